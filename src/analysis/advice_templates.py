@@ -1,7 +1,11 @@
 """Coaching message templates for generating personalized advice."""
 
-from typing import Dict, Any, List
-from .metrics_definitions import get_metric_definition
+import sys
+from bisect import bisect_right
+from functools import lru_cache
+from string import Formatter
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple, Callable
 
 
 # Rule-based coaching templates
@@ -58,21 +62,21 @@ RULE_BASED_TEMPLATES = {
     
     # Training pack recommendations
     "training_packs": {
-        "shooting_percentage": [
+        "shooting_percentage": (
             "Ultimate Shooting by Poquito",
             "Ground Shots by Wayprotein", 
             "Redirects by IP Joker"
-        ],
-        "avg_speed": [
+        ),
+        "avg_speed": (
             "Speed Jump Reset by Musty",
             "Air Roll Shots by CBell",
             "Fast Aerial Practice"
-        ],
-        "saves": [
+        ),
+        "saves": (
             "Saves Pack by Browser",
             "Defensive Training by Sunless",
             "Awkward Saves by Poquito"
-        ]
+        )
     }
 }
 
@@ -106,9 +110,69 @@ PRIORITY_PHRASES = {
 }
 
 
-def get_training_pack_recommendations(metric_name: str) -> List[str]:
+def _compile_template(template: str, field_names: Tuple[str, ...]) -> Callable[..., str]:
+    """Compile a template once into a function that renders it as an f-string.
+    
+    The returned function takes the field values positionally, in the order
+    given by field_names, so no keyword dict is built per call.
+    """
+    parts = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        parts.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field_name is None:
+            continue
+        if field_name not in field_names or "{" in format_spec:
+            raise ValueError(f"Unsupported template field {field_name!r} in {template!r}")
+        parts.append(
+            "{" + field_name
+            + (f"!{conversion}" if conversion else "")
+            + (f":{format_spec}" if format_spec else "")
+            + "}"
+        )
+    
+    namespace: Dict[str, Any] = {}
+    exec(f"def render({', '.join(field_names)}):\n    return f{''.join(parts)!r}\n", namespace)
+    return namespace["render"]
+
+
+_RULE_BASED_FIELDS = ("value", "rank")
+_CORRELATION_FIELDS = ("metric_name", "wins_value", "losses_value")
+
+
+# Read-only view of the training pack recommendations
+_TRAINING_PACKS = MappingProxyType(RULE_BASED_TEMPLATES["training_packs"])
+_NO_TRAINING_PACKS: Tuple[str, ...] = ()
+
+
+def _intern(name: str) -> str:
+    """Intern a plain str; str subclasses (e.g. numpy.str_) pass through as is."""
+    return sys.intern(name) if type(name) is str else name
+
+
+def get_training_pack_recommendations(metric_name: str) -> Tuple[str, ...]:
     """Get training pack recommendations for a specific metric."""
-    return RULE_BASED_TEMPLATES.get("training_packs", {}).get(metric_name, [])
+    return _TRAINING_PACKS.get(_intern(metric_name), _NO_TRAINING_PACKS)
+
+
+def _training_suffix(metric_name: str, comparison: str) -> str:
+    """Get the training recommendation suffix baked into a rule-based template."""
+    training_packs = _TRAINING_PACKS.get(metric_name)
+    if comparison != "below_rank" or not training_packs:
+        return ""
+    return f"\n\nRecommended training: {', '.join(training_packs[:2])}"
+
+
+# Rule-based templates compiled once at import, keyed by (metric_name, comparison).
+# Each entry holds (without training, with training) renderers.
+_COMPILED_TEMPLATES: Dict[Tuple[str, str], Tuple[Callable[..., str], Callable[..., str]]] = {
+    (metric_name, comparison): (
+        _compile_template(template, _RULE_BASED_FIELDS),
+        _compile_template(template + _training_suffix(metric_name, comparison), _RULE_BASED_FIELDS),
+    )
+    for metric_name, templates in RULE_BASED_TEMPLATES.items()
+    if metric_name != "training_packs"
+    for comparison, template in templates.items()
+}
 
 
 def format_rule_based_message(
@@ -119,21 +183,82 @@ def format_rule_based_message(
     include_training: bool = True
 ) -> str:
     """Format a rule-based coaching message."""
-    templates = RULE_BASED_TEMPLATES.get(metric_name, {})
+    # Metric names often arrive as freshly built strings (e.g. parsed JSON);
+    # interning them lets the template lookups below match by identity.
+    metric_name = _intern(metric_name)
+    comparison = _intern(comparison)
+    renderers = _COMPILED_TEMPLATES.get((metric_name, comparison))
     
-    if comparison not in templates:
+    if renderers is None:
         return f"Your {metric_name} is {value}. Continue monitoring this metric."
     
-    # Get the base message template
-    message = templates[comparison].format(value=value, rank=rank)
+    # Training recommendations are already baked into the second renderer
+    render = renderers[1] if include_training else renderers[0]
+    return render(value, rank)
+
+
+# Value format spec and unit suffix for each kind of correlation metric
+_CORRELATION_VALUE_FORMATS: Dict[str, Tuple[str, str]] = {
+    "percentage": (".1f", "%"),
+    "seconds": (".1f", "s"),
+    "count": (".0f", ""),
+}
+
+
+def _with_value_format(template: str, value_format: str) -> str:
+    """Bake a value format into a correlation template's wins/losses fields."""
+    format_spec, suffix = _CORRELATION_VALUE_FORMATS[value_format]
+    for field_name in ("wins_value", "losses_value"):
+        template = template.replace(
+            "{" + field_name + "}", "{" + field_name + ":" + format_spec + "}" + suffix
+        )
+    return template
+
+
+# Correlation templates with their confidence modifier and value format baked
+# in, compiled once at import and keyed by (template_key, confidence_level,
+# value_format). The "" level has no modifier and covers unknown confidence levels.
+_COMPILED_CORRELATION_TEMPLATES: Dict[Tuple[str, str, str], Callable[..., str]] = {
+    (template_key, confidence_level, value_format): _compile_template(
+        _with_value_format(template, value_format) + modifier, _CORRELATION_FIELDS
+    )
+    for template_key, template in CORRELATION_TEMPLATES.items()
+    for confidence_level, modifier in {**CONFIDENCE_MODIFIERS, "": ""}.items()
+    for value_format in _CORRELATION_VALUE_FORMATS
+}
+
+# Template selection keyed by (sign of wins - losses, higher_is_better)
+_CORRELATION_TEMPLATE_KEYS: Dict[Tuple[int, bool], str] = {
+    (1, True): "positive_correlation",
+    (-1, False): "positive_correlation",
+    (-1, True): "negative_correlation",
+    (1, False): "negative_correlation",
+    (0, True): "unexpected_pattern",
+    (0, False): "unexpected_pattern",
+}
+
+
+@lru_cache(maxsize=256)
+def _correlation_display_info(
+    metric_name: str
+) -> Optional[Tuple[str, bool, str]]:
+    """Get (display name, higher is better, value format) for a metric, or None if unknown."""
+    # Imported lazily so rule-based callers don't pay for loading metric definitions
+    from .metrics_definitions import get_metric_definition, is_valid_metric
+    
+    if not is_valid_metric(metric_name):
+        return None
     
-    # Add training recommendations if requested and available
-    if include_training and comparison == "below_rank":
-        training_packs = get_training_pack_recommendations(metric_name)
-        if training_packs:
-            message += f"\n\nRecommended training: {', '.join(training_packs[:2])}"
+    definition = get_metric_definition(metric_name)
+    
+    if 'percentage' in definition.unit:
+        value_format = "percentage"
+    elif 'time' in metric_name:
+        value_format = "seconds"
+    else:
+        value_format = "count"
     
-    return message
+    return definition.display_name.lower(), bool(definition.higher_is_better), value_format
 
 
 def format_correlation_message(
@@ -144,59 +269,43 @@ def format_correlation_message(
     effect_size: float
 ) -> str:
     """Format a correlation-based coaching message."""
-    try:
-        definition = get_metric_definition(metric_name)
-        display_name = definition.display_name
-        
-        # Determine template based on correlation direction and magnitude
-        if abs(effect_size) < 0.2:
-            template_key = "minimal_difference"
-        elif (definition.higher_is_better and wins_value > losses_value) or \
-             (not definition.higher_is_better and wins_value < losses_value):
-            template_key = "positive_correlation"
-        elif (definition.higher_is_better and wins_value < losses_value) or \
-             (not definition.higher_is_better and wins_value > losses_value):
-            template_key = "negative_correlation"
-        else:
-            template_key = "unexpected_pattern"
-        
-        # Format values appropriately
-        if 'percentage' in definition.unit:
-            wins_formatted = f"{wins_value:.1f}%"
-            losses_formatted = f"{losses_value:.1f}%"
-        elif 'time' in metric_name:
-            wins_formatted = f"{wins_value:.1f}s"
-            losses_formatted = f"{losses_value:.1f}s"
-        else:
-            wins_formatted = f"{wins_value:.0f}"
-            losses_formatted = f"{losses_value:.0f}"
-        
-        # Generate message
-        message = CORRELATION_TEMPLATES[template_key].format(
-            metric_name=display_name.lower(),
-            wins_value=wins_formatted,
-            losses_value=losses_formatted
-        )
-        
-        # Add confidence modifier
-        message += CONFIDENCE_MODIFIERS.get(confidence_level, "")
-        
-        return message
-    
-    except Exception:
+    metric_name = _intern(metric_name)
+    display_info = _correlation_display_info(metric_name)
+    if display_info is None:
         return f"Correlation found for {metric_name}: wins avg {wins_value:.1f}, losses avg {losses_value:.1f}"
+    
+    display_name, higher_is_better, value_format = display_info
+    
+    # Determine template based on correlation direction and magnitude
+    if abs(effect_size) < 0.2:
+        template_key = "minimal_difference"
+    else:
+        direction = int(wins_value > losses_value) - int(wins_value < losses_value)
+        template_key = _CORRELATION_TEMPLATE_KEYS[(direction, higher_is_better)]
+    
+    # Pick the template variant carrying this confidence modifier and value format
+    render = (
+        _COMPILED_CORRELATION_TEMPLATES.get((template_key, confidence_level, value_format))
+        or _COMPILED_CORRELATION_TEMPLATES[(template_key, "", value_format)]
+    )
+    
+    # Generate message
+    return render(display_name, wins_value, losses_value)
+
+
+# Score thresholds and the phrases they open, lowest first
+_PRIORITY_THRESHOLDS = (40, 60, 80)
+_PRIORITY_LEVELS = tuple(
+    PRIORITY_PHRASES[level] for level in ("minor", "moderate", "important", "critical")
+)
 
 
 def get_priority_phrase(priority_score: float) -> str:
     """Get priority phrase based on score."""
-    if priority_score >= 80:
-        return PRIORITY_PHRASES["critical"]
-    elif priority_score >= 60:
-        return PRIORITY_PHRASES["important"]
-    elif priority_score >= 40:
-        return PRIORITY_PHRASES["moderate"]
-    else:
-        return PRIORITY_PHRASES["minor"]
+    # NaN fails every threshold comparison; keep it at the lowest level
+    if priority_score != priority_score:
+        return _PRIORITY_LEVELS[0]
+    return _PRIORITY_LEVELS[bisect_right(_PRIORITY_THRESHOLDS, priority_score)]
 
 
 def format_insight_summary(insights: List[Dict[str, Any]]) -> str:
@@ -204,18 +313,22 @@ def format_insight_summary(insights: List[Dict[str, Any]]) -> str:
     if not insights:
         return "No significant insights found. Continue playing and gathering data."
     
-    high_confidence = [i for i in insights if i.get('confidence_level') == 'high']
-    medium_confidence = [i for i in insights if i.get('confidence_level') == 'medium']
+    # Count confidence levels in a single pass
+    high_confidence = medium_confidence = 0
+    for insight in insights:
+        confidence_level = insight.get('confidence_level')
+        if confidence_level == 'high':
+            high_confidence += 1
+        elif confidence_level == 'medium':
+            medium_confidence += 1
     
-    summary = f"📊 Found {len(insights)} insights"
+    parts = [f"📊 Found {len(insights)} insights"]
     
-    if high_confidence:
-        summary += f" ({len(high_confidence)} high confidence"
-        if medium_confidence:
-            summary += f", {len(medium_confidence)} medium confidence)"
-        else:
-            summary += ")"
+    if high_confidence and medium_confidence:
+        parts.append(f" ({high_confidence} high confidence, {medium_confidence} medium confidence)")
+    elif high_confidence:
+        parts.append(f" ({high_confidence} high confidence)")
     elif medium_confidence:
-        summary += f" ({len(medium_confidence)} medium confidence)"
+        parts.append(f" ({medium_confidence} medium confidence)")
     
-    return summary
+    return "".join(parts)
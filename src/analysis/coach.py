@@ -1,17 +1,34 @@
 """Main coaching engine that combines rule-based insights with correlation analysis."""
 
-from typing import Dict, Any, List, Optional, Tuple
+from functools import cached_property, lru_cache
+from itertools import chain, islice
+from numbers import Real
+from operator import attrgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, List, NamedTuple, Optional, Tuple
 import asyncio
+import heapq
+import json
+import sys
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from ..logging_config import get_logger, log_performance, LoggingMixin
 from .exceptions import InsufficientDataException
 from .metrics_definitions import (
-    get_rank_benchmark,
+    get_rank_benchmark_array,
     get_metric_definition,
     get_all_metric_names,
+    is_valid_metric,
     MetricTier,
+    BENCHMARK_THRESHOLDS,
 )
-from .statistical_analyzer import StatisticalAnalyzer, CorrelationResult
 from .advice_templates import (
     format_rule_based_message,
     format_correlation_message,
@@ -19,10 +36,64 @@ from .advice_templates import (
     format_insight_summary,
 )
 
+if TYPE_CHECKING:
+    from .statistical_analyzer import StatisticalAnalyzer, CorrelationResult
+
+
+# Position of each metric in the rank benchmark arrays
+_BENCHMARK_METRIC_INDEX: Dict[str, int] = {
+    name: index for index, name in enumerate(get_all_metric_names())
+}
+_MIN_COLUMN = BENCHMARK_THRESHOLDS.index("min")
+_GOOD_COLUMN = BENCHMARK_THRESHOLDS.index("good")
+
+
+@lru_cache(maxsize=64)
+def _get_rank_benchmarks(player_rank: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the min/good benchmark arrays for a player rank as given by the caller."""
+    benchmarks = get_rank_benchmark_array(player_rank)
+    return benchmarks[:, _MIN_COLUMN], benchmarks[:, _GOOD_COLUMN]
+
+
+# Comparison labels indexed by the codes computed in _compare_to_benchmarks
+_COMPARISONS = ("below_rank", "above_rank", "at_rank")
+
+# Priority phrase for every whole score in [0, 100]. The phrase thresholds are
+# integers, so truncating a score in range never changes its band.
+_PRIORITY_PHRASE_LUT = tuple(get_priority_phrase(score) for score in range(101))
+
+
+def _priority_phrase(priority_score: float) -> str:
+    """Look up the priority phrase for a score, tabulated for in-range scores."""
+    if 0 <= priority_score <= 100:
+        return _PRIORITY_PHRASE_LUT[int(priority_score)]
+    return get_priority_phrase(priority_score)
+
+
+# Actionable advice for metrics that fall below the player's rank benchmark
+_BELOW_RANK_ADVICE = MappingProxyType({
+    "avg_speed": "Focus on maintaining momentum through powerslide turns and efficient boost usage.",
+    "shooting_percentage": "Practice shot accuracy in training packs and be more selective with shot attempts.",
+    "avg_amount": "Improve boost collection routes and avoid wasteful supersonic driving.",
+    "time_zero_boost": "Better boost management - collect boost more frequently and use it efficiently.",
+    "saves": "Work on defensive positioning and anticipation to make more saves.",
+})
+
 
 class CoachingInsight:
     """Represents a single coaching insight."""
     
+    __slots__ = (
+        'insight_type',
+        'metric_name',
+        'title',
+        'message',
+        'priority_score',
+        'confidence_level',
+        'actionable_advice',
+        'training_recommendations',
+    )
+    
     def __init__(
         self,
         insight_type: str,  # "rule_based" or "correlation"
@@ -35,7 +106,8 @@ class CoachingInsight:
         training_recommendations: List[str] = None
     ):
         self.insight_type = insight_type
-        self.metric_name = metric_name
+        # numpy.str_ and other str subclasses can't be interned
+        self.metric_name = sys.intern(metric_name) if type(metric_name) is str else metric_name
         self.title = title
         self.message = message
         self.priority_score = priority_score
@@ -57,11 +129,33 @@ class CoachingInsight:
         }
 
 
+def _insight_default(obj: Any) -> Dict[str, Any]:
+    """JSON serializer hook for CoachingInsight objects."""
+    if isinstance(obj, CoachingInsight):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class _InsightTally(NamedTuple):
+    """Summary counts collected from one pass over a set of insights."""
+    high_confidence: int
+    actionable: int
+    correlation: int
+    first_high_priority_metric: Optional[str]
+
+
 class CoachingEngine(LoggingMixin):
     """Main coaching engine that generates personalized insights."""
     
-    def __init__(self):
-        self.statistical_analyzer = StatisticalAnalyzer()
+    @cached_property
+    def statistical_analyzer(self) -> "StatisticalAnalyzer":
+        """Statistical analyzer, created on first use.
+        
+        Importing it pulls in SciPy (and Numba when installed), which the
+        rule-based path does not need.
+        """
+        from .statistical_analyzer import StatisticalAnalyzer
+        return StatisticalAnalyzer()
     
     async def generate_coaching_insights(
         self,
@@ -70,6 +164,43 @@ class CoachingEngine(LoggingMixin):
         player_rank: str = "platinum"
     ) -> Dict[str, Any]:
         """Generate complete coaching analysis with both rule-based and correlation insights."""
+        return await self._build_coaching_report(player_metrics, games_data, player_rank)
+    
+    async def generate_coaching_report_bytes(
+        self,
+        player_metrics: Dict[str, float],
+        games_data: List[Dict[str, Any]],
+        player_rank: str = "platinum"
+    ) -> bytes:
+        """Generate the coaching report serialized as JSON bytes.
+        
+        Insights are serialized straight from CoachingInsight objects rather
+        than materializing their dictionaries first. Uses orjson when installed.
+        """
+        coaching_report = await self._build_coaching_report(
+            player_metrics, games_data, player_rank, serialize_insights=False
+        )
+        
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(
+                coaching_report,
+                default=_insight_default,
+                option=orjson.OPT_SERIALIZE_NUMPY
+            )
+        return json.dumps(coaching_report, default=_insight_default).encode()
+    
+    async def _build_coaching_report(
+        self,
+        player_metrics: Dict[str, float],
+        games_data: List[Dict[str, Any]],
+        player_rank: str,
+        serialize_insights: bool = True
+    ) -> Dict[str, Any]:
+        """Build the coaching report.
+        
+        When serialize_insights is False the insight lists hold CoachingInsight
+        objects for the caller to serialize.
+        """
         with log_performance(f"coaching_analysis_{len(games_data)}_games"):
             self.logger.info(
                 "Starting coaching analysis",
@@ -78,17 +209,29 @@ class CoachingEngine(LoggingMixin):
                 metrics_count=len(player_metrics)
             )
             
-            # Generate rule-based insights
-            rule_based_insights = self.generate_rule_based_insights(player_metrics, player_rank)
+            # Intern metric names once so definition and benchmark lookups
+            # (keyed by interned literals) match on identity; str subclasses
+            # such as numpy.str_ can't be interned and are kept as is
+            player_metrics = {
+                sys.intern(name) if type(name) is str else name: value
+                for name, value in player_metrics.items()
+            }
+            
+            # Rule-based and correlation insights are independent, so run both
+            # off the event loop concurrently
+            rule_based_task = asyncio.create_task(
+                asyncio.to_thread(self.generate_rule_based_insights, player_metrics, player_rank)
+            )
+            correlation_task = asyncio.create_task(
+                asyncio.to_thread(self._run_correlation_analysis, games_data)
+            )
             
             # Generate correlation insights (if sufficient data)
             correlation_insights = []
             correlation_summary = {}
             
             try:
-                correlation_results = self.statistical_analyzer.analyze_win_loss_correlations(games_data)
-                correlation_insights = self._convert_correlations_to_insights(correlation_results)
-                correlation_summary = self._generate_correlation_summary(correlation_results)
+                correlation_insights, correlation_summary = await correlation_task
             except InsufficientDataException as e:
                 self.logger.info(
                     "Insufficient data for correlation analysis",
@@ -109,9 +252,24 @@ class CoachingEngine(LoggingMixin):
                     'message': "Correlation analysis encountered an error"
                 }
             
+            rule_based_insights = await rule_based_task
+            
             # Combine and prioritize all insights
             all_insights = rule_based_insights + correlation_insights
-            prioritized_insights = self.prioritize_insights(all_insights)
+            # Only the top 10 are reported, so skip sorting the rest
+            prioritized_insights = self.prioritize_insights(all_insights, top_k=10)
+            
+            # Tally summary counts in a single pass
+            tally = self._tally_insights(all_insights)
+            
+            if serialize_insights:
+                # Serialize each insight once; the prioritized list reuses the same dicts
+                insight_dicts = {id(insight): insight.to_dict() for insight in all_insights}
+                
+                def export(insights: List[CoachingInsight]) -> List[Any]:
+                    return [insight_dicts[id(insight)] for insight in insights]
+            else:
+                export = list
             
             # Generate final coaching report
             coaching_report = {
@@ -119,21 +277,21 @@ class CoachingEngine(LoggingMixin):
                 'games_analyzed': len(games_data),
                 'metrics_analyzed': len(player_metrics),
                 'insights': {
-                    'rule_based': [insight.to_dict() for insight in rule_based_insights],
-                    'correlation': [insight.to_dict() for insight in correlation_insights],
-                    'prioritized': [insight.to_dict() for insight in prioritized_insights[:10]]  # Top 10
+                    'rule_based': export(rule_based_insights),
+                    'correlation': export(correlation_insights),
+                    'prioritized': export(prioritized_insights)  # Top 10
                 },
                 'summary': {
                     'total_insights': len(all_insights),
-                    'high_confidence': len([i for i in all_insights if i.confidence_level == 'high']),
-                    'actionable_items': len([i for i in all_insights if i.actionable_advice]),
+                    'high_confidence': tally.high_confidence,
+                    'actionable_items': tally.actionable,
                     'correlation_analysis': correlation_summary,
-                    'overview': self._generate_overview(prioritized_insights)
+                    'overview': self._generate_overview(prioritized_insights, tally.correlation)
                 },
                 'recommendations': {
                     'immediate_focus': self._get_immediate_focus_areas(prioritized_insights[:3]),
                     'training_packs': self._consolidate_training_recommendations(all_insights),
-                    'next_steps': self._generate_next_steps(games_data, all_insights)
+                    'next_steps': self._generate_next_steps(games_data, tally.first_high_priority_metric)
                 }
             }
             
@@ -142,11 +300,21 @@ class CoachingEngine(LoggingMixin):
                 total_insights=len(all_insights),
                 rule_based=len(rule_based_insights),
                 correlation=len(correlation_insights),
-                high_confidence=coaching_report['summary']['high_confidence']
+                high_confidence=tally.high_confidence
             )
             
             return coaching_report
     
+    def _run_correlation_analysis(
+        self,
+        games_data: List[Dict[str, Any]]
+    ) -> Tuple[List[CoachingInsight], Dict[str, Any]]:
+        """Run win/loss correlation analysis and convert the results to insights."""
+        correlation_results = self.statistical_analyzer.analyze_win_loss_correlations(games_data)
+        correlation_insights = self._convert_correlations_to_insights(correlation_results)
+        correlation_summary = self._generate_correlation_summary(correlation_results)
+        return correlation_insights, correlation_summary
+    
     def generate_rule_based_insights(
         self,
         player_metrics: Dict[str, float],
@@ -155,48 +323,84 @@ class CoachingEngine(LoggingMixin):
         """Generate insights based on rank benchmarks."""
         insights = []
         
+        # Collect the metrics worth comparing
+        metric_names = []
+        metric_values = []
+        add_name = metric_names.append
+        add_value = metric_values.append
         for metric_name, value in player_metrics.items():
-            try:
-                if not value or value < 0:  # Skip invalid values
-                    continue
-                
-                # Get rank benchmark
-                benchmark = get_rank_benchmark(player_rank, metric_name)
-                if not benchmark:
-                    continue
-                
-                # Determine comparison level
-                comparison = self._compare_to_benchmark(value, benchmark)
-                
-                # Generate insight
-                insight = self._create_rule_based_insight(
-                    metric_name, value, player_rank, comparison, benchmark
-                )
-                
-                if insight:
-                    insights.append(insight)
+            if metric_name not in _BENCHMARK_METRIC_INDEX:  # No definition to compare against
+                continue
             
-            except Exception as e:
-                self.logger.warning(
-                    "Failed to generate rule-based insight",
-                    metric=metric_name,
-                    error=str(e)
-                )
+            if not isinstance(value, Real):
+                if value is not None:
+                    self.logger.warning(
+                        "Failed to generate rule-based insight",
+                        metric=metric_name,
+                        error=f"Non-numeric value of type {type(value).__name__}"
+                    )
+                continue
+            
+            if not value or value < 0:  # Skip invalid values
+                continue
+            
+            add_name(metric_name)
+            add_value(value)
+        
+        if not metric_names:
+            return insights
+        
+        # Compare every metric against its rank benchmark in one vectorized pass
+        comparisons, priority_scores = self._compare_to_benchmarks(
+            metric_names, metric_values, player_rank
+        )
+        
+        create_insight = self._create_rule_based_insight
+        add_insight = insights.append
+        for metric_name, value, comparison, priority_score in zip(
+            metric_names, metric_values, comparisons.tolist(), priority_scores.tolist()
+        ):
+            add_insight(create_insight(
+                metric_name, value, player_rank, _COMPARISONS[comparison], priority_score
+            ))
         
         return insights
     
-    def _compare_to_benchmark(self, value: float, benchmark: Dict[str, float]) -> str:
-        """Compare metric value to rank benchmark."""
-        min_val = benchmark.get('min', 0)
-        avg_val = benchmark.get('avg', 0)
-        good_val = benchmark.get('good', 0)
-        
-        if value < min_val:
-            return "below_rank"
-        elif value >= good_val:
-            return "above_rank"
-        else:
-            return "at_rank"
+    def _compare_to_benchmarks(
+        self,
+        metric_names: List[str],
+        values: List[float],
+        player_rank: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Compare metric values to rank benchmarks.
+        
+        Returns:
+            Tuple of (comparison codes indexing _COMPARISONS, priority scores)
+        """
+        mins, goods = _get_rank_benchmarks(player_rank)
+        
+        indices = np.fromiter(
+            (_BENCHMARK_METRIC_INDEX[name] for name in metric_names),
+            dtype=np.intp,
+            count=len(metric_names)
+        )
+        values = np.asarray(values, dtype=np.float64)
+        mins = mins[indices]
+        goods = goods[indices]
+        
+        below = values < mins
+        comparisons = np.where(below, 0, np.where(values >= goods, 1, 2))
+        
+        # Higher priority for metrics significantly below rank (70-100 range),
+        # lower priority for things already good, medium for at-rank performance
+        deviation = np.divide(mins - values, mins, out=np.zeros_like(values), where=mins > 0)
+        priority_scores = np.where(
+            below,
+            np.minimum(70 + deviation * 30, 100),
+            np.where(comparisons == 1, 30.0, 50.0)
+        )
+        
+        return comparisons, priority_scores
     
     def _create_rule_based_insight(
         self,
@@ -204,78 +408,41 @@ class CoachingEngine(LoggingMixin):
         value: float,
         rank: str,
         comparison: str,
-        benchmark: Dict[str, float]
-    ) -> Optional[CoachingInsight]:
-        """Create a rule-based coaching insight."""
-        try:
-            definition = get_metric_definition(metric_name)
-            
-            # Calculate priority score based on deviation from benchmark
-            priority_score = self._calculate_rule_based_priority(value, benchmark, comparison)
-            
-            # Generate message
-            message = format_rule_based_message(metric_name, value, rank, comparison)
-            
-            # Determine confidence level (rule-based insights are generally medium confidence)
-            confidence_level = "medium"
-            
-            # Generate actionable advice
-            actionable_advice = self._generate_rule_based_advice(metric_name, comparison)
-            
-            # Create title
-            priority_phrase = get_priority_phrase(priority_score)
-            title = f"{priority_phrase}: {definition.display_name}"
-            
-            insight = CoachingInsight(
-                insight_type="rule_based",
-                metric_name=metric_name,
-                title=title,
-                message=message,
-                priority_score=priority_score,
-                confidence_level=confidence_level,
-                actionable_advice=actionable_advice
-            )
-            
-            return insight
+        priority_score: float
+    ) -> CoachingInsight:
+        """Create a rule-based coaching insight for a metric with a known definition."""
+        definition = get_metric_definition(metric_name)
         
-        except Exception as e:
-            self.logger.warning(
-                "Failed to create rule-based insight",
-                metric=metric_name,
-                error=str(e)
-            )
-            return None
-    
-    def _calculate_rule_based_priority(
-        self,
-        value: float,
-        benchmark: Dict[str, float],
-        comparison: str
-    ) -> float:
-        """Calculate priority score for rule-based insight."""
-        if comparison == "below_rank":
-            # Higher priority for metrics significantly below rank
-            min_val = benchmark.get('min', 0)
-            if min_val > 0:
-                deviation = (min_val - value) / min_val
-                return min(70 + (deviation * 30), 100)  # 70-100 range
-            return 70
-        elif comparison == "above_rank":
-            return 30  # Lower priority for things already good
-        else:
-            return 50  # Medium priority for at-rank performance
+        # Generate message
+        message = format_rule_based_message(metric_name, value, rank, comparison)
+        
+        # Determine confidence level (rule-based insights are generally medium confidence)
+        confidence_level = "medium"
+        
+        # Generate actionable advice
+        actionable_advice = self._generate_rule_based_advice(metric_name, comparison)
+        
+        # Create title
+        priority_phrase = _priority_phrase(priority_score)
+        title = f"{priority_phrase}: {definition.display_name}"
+        
+        return CoachingInsight(
+            insight_type="rule_based",
+            metric_name=metric_name,
+            title=title,
+            message=message,
+            priority_score=priority_score,
+            confidence_level=confidence_level,
+            actionable_advice=actionable_advice
+        )
     
     def _generate_rule_based_advice(self, metric_name: str, comparison: str) -> str:
         """Generate actionable advice for rule-based insights."""
         if comparison == "below_rank":
-            advice_map = {
-                "avg_speed": "Focus on maintaining momentum through powerslide turns and efficient boost usage.",
-                "shooting_percentage": "Practice shot accuracy in training packs and be more selective with shot attempts.",
-                "avg_amount": "Improve boost collection routes and avoid wasteful supersonic driving.",
-                "time_zero_boost": "Better boost management - collect boost more frequently and use it efficiently.",
-                "saves": "Work on defensive positioning and anticipation to make more saves.",
-            }
-            return advice_map.get(metric_name, f"Focus on improving your {metric_name} through targeted practice.")
+            advice = _BELOW_RANK_ADVICE.get(metric_name)
+            if advice is not None:
+                return advice
+            return f"Focus on improving your {metric_name} through targeted practice."
         elif comparison == "above_rank":
             return f"Maintain your strong {metric_name} performance while working on other areas."
         else:
@@ -283,59 +450,64 @@ class CoachingEngine(LoggingMixin):
     
     def _convert_correlations_to_insights(
         self,
-        correlation_results: Dict[str, CorrelationResult]
+        correlation_results: Dict[str, "CorrelationResult"]
     ) -> List[CoachingInsight]:
         """Convert correlation results to coaching insights."""
         insights = []
         
+        # Bind per-result helpers once outside the loop
+        calculate_priority = self._calculate_correlation_priority
+        generate_advice = self._generate_correlation_advice
+        add_insight = insights.append
+        
         for result in correlation_results.values():
-            try:
-                if not result.statistically_significant:
-                    continue
-                
-                definition = get_metric_definition(result.metric_name)
-                
-                # Calculate priority score
-                priority_score = self._calculate_correlation_priority(result)
-                
-                # Generate message
-                message = format_correlation_message(
-                    result.metric_name,
-                    result.wins_mean,
-                    result.losses_mean,
-                    result.confidence_level,
-                    result.effect_size
-                )
-                
-                # Create title
-                priority_phrase = get_priority_phrase(priority_score)
-                title = f"{priority_phrase}: {definition.display_name} Pattern"
-                
-                # Generate actionable advice
-                actionable_advice = self._generate_correlation_advice(result)
-                
-                insight = CoachingInsight(
-                    insight_type="correlation",
-                    metric_name=result.metric_name,
-                    title=title,
-                    message=message,
-                    priority_score=priority_score,
-                    confidence_level=result.confidence_level,
-                    actionable_advice=actionable_advice
-                )
-                
-                insights.append(insight)
+            if not result.statistically_significant:
+                continue
             
-            except Exception as e:
+            if not is_valid_metric(result.metric_name):
                 self.logger.warning(
                     "Failed to convert correlation to insight",
                     metric=result.metric_name,
-                    error=str(e)
+                    error=f"Unknown metric: {result.metric_name}"
                 )
+                continue
+            
+            definition = get_metric_definition(result.metric_name)
+            
+            # Calculate priority score
+            priority_score = calculate_priority(result)
+            
+            # Generate message
+            message = format_correlation_message(
+                result.metric_name,
+                result.wins_mean,
+                result.losses_mean,
+                result.confidence_level,
+                result.effect_size
+            )
+            
+            # Create title
+            priority_phrase = _priority_phrase(priority_score)
+            title = f"{priority_phrase}: {definition.display_name} Pattern"
+            
+            # Generate actionable advice
+            actionable_advice = generate_advice(result)
+            
+            insight = CoachingInsight(
+                insight_type="correlation",
+                metric_name=result.metric_name,
+                title=title,
+                message=message,
+                priority_score=priority_score,
+                confidence_level=result.confidence_level,
+                actionable_advice=actionable_advice
+            )
+            
+            add_insight(insight)
         
         return insights
     
-    def _calculate_correlation_priority(self, result: CorrelationResult) -> float:
+    def _calculate_correlation_priority(self, result: "CorrelationResult") -> float:
         """Calculate priority score for correlation insight."""
         score = 0.0
         
@@ -350,16 +522,13 @@ class CoachingEngine(LoggingMixin):
         else:
             score += 10
         
-        # Tier contribution (0-20 points)
-        try:
-            definition = get_metric_definition(result.metric_name)
-            if definition.tier == MetricTier.TIER_1:
-                score += 20
-            elif definition.tier == MetricTier.TIER_2:
-                score += 15
-            else:
-                score += 10
-        except:
+        # Tier contribution (0-20 points); unknown metrics score as lowest tier
+        tier = get_metric_definition(result.metric_name).tier if is_valid_metric(result.metric_name) else None
+        if tier == MetricTier.TIER_1:
+            score += 20
+        elif tier == MetricTier.TIER_2:
+            score += 15
+        else:
             score += 10
         
         # Practical significance bonus (0-10 points)
@@ -368,41 +537,47 @@ class CoachingEngine(LoggingMixin):
         
         return min(score, 100)
     
-    def _generate_correlation_advice(self, result: CorrelationResult) -> str:
+    def _generate_correlation_advice(self, result: "CorrelationResult") -> str:
         """Generate actionable advice for correlation insights."""
-        try:
-            definition = get_metric_definition(result.metric_name)
-            
-            # Determine if the correlation is positive (wins are better)
-            if definition.higher_is_better is True:
-                wins_better = result.wins_mean > result.losses_mean
-            elif definition.higher_is_better is False:
-                wins_better = result.wins_mean < result.losses_mean
-            else:
-                wins_better = True  # Assume the pattern is meaningful
-            
-            if wins_better:
-                return f"Maintain the {definition.display_name.lower()} level shown in your winning games."
-            else:
-                return f"Analyze what's different about your {definition.display_name.lower()} in winning vs losing games."
-        
-        except Exception:
+        if not is_valid_metric(result.metric_name):
             return "Review this metric's patterns between wins and losses."
+        
+        definition = get_metric_definition(result.metric_name)
+        
+        # Determine if the correlation is positive (wins are better)
+        if definition.higher_is_better is True:
+            wins_better = result.wins_mean > result.losses_mean
+        elif definition.higher_is_better is False:
+            wins_better = result.wins_mean < result.losses_mean
+        else:
+            wins_better = True  # Assume the pattern is meaningful
+        
+        if wins_better:
+            return f"Maintain the {definition.display_name.lower()} level shown in your winning games."
+        else:
+            return f"Analyze what's different about your {definition.display_name.lower()} in winning vs losing games."
     
-    def prioritize_insights(self, insights: List[CoachingInsight]) -> List[CoachingInsight]:
-        """Prioritize and sort insights by importance."""
-        # Sort by priority score (highest first)
-        sorted_insights = sorted(insights, key=lambda x: x.priority_score, reverse=True)
+    def prioritize_insights(
+        self,
+        insights: List[CoachingInsight],
+        top_k: Optional[int] = None
+    ) -> List[CoachingInsight]:
+        """Prioritize and sort insights by importance.
         
+        If top_k is given only the top_k highest-priority insights are returned,
+        selected with a heap instead of sorting the full list.
+        """
         # Boost correlation insights slightly if they're high confidence
-        for insight in sorted_insights:
+        for insight in insights:
             if (insight.insight_type == "correlation" and 
                 insight.confidence_level == "high" and
                 insight.priority_score > 70):
                 insight.priority_score = min(insight.priority_score + 5, 100)
         
-        # Re-sort after adjustment
-        return sorted(sorted_insights, key=lambda x: x.priority_score, reverse=True)
+        # Sort by adjusted priority score (highest first)
+        if top_k is not None:
+            return heapq.nlargest(top_k, insights, key=attrgetter('priority_score'))
+        return sorted(insights, key=attrgetter('priority_score'), reverse=True)
     
     def format_actionable_advice(self, insights: List[CoachingInsight]) -> Dict[str, Any]:
         """Format insights into actionable advice structure."""
@@ -421,28 +596,46 @@ class CoachingEngine(LoggingMixin):
             ]
         }
     
-    def _generate_correlation_summary(self, correlation_results: Dict[str, CorrelationResult]) -> Dict[str, Any]:
+    def _generate_correlation_summary(self, correlation_results: Dict[str, "CorrelationResult"]) -> Dict[str, Any]:
         """Generate summary of correlation analysis."""
         if not correlation_results:
             return {'no_correlations': True}
         
-        significant_count = sum(1 for r in correlation_results.values() if r.statistically_significant)
-        high_confidence_count = sum(1 for r in correlation_results.values() if r.confidence_level == 'high')
+        # Tally all aggregates in a single pass over the results
+        significant_count = 0
+        high_confidence_count = 0
+        sample_size_adequate = True
+        for result in correlation_results.values():
+            if result.statistically_significant:
+                significant_count += 1
+            if result.confidence_level == 'high':
+                high_confidence_count += 1
+            if not result.sample_size_adequate:
+                sample_size_adequate = False
         
         return {
             'total_analyzed': len(correlation_results),
             'significant_correlations': significant_count,
             'high_confidence_findings': high_confidence_count,
-            'sample_size_adequate': all(r.sample_size_adequate for r in correlation_results.values()),
+            'sample_size_adequate': sample_size_adequate,
             'strongest_correlation': self._find_strongest_correlation(correlation_results)
         }
     
-    def _find_strongest_correlation(self, correlation_results: Dict[str, CorrelationResult]) -> Dict[str, Any]:
+    def _find_strongest_correlation(self, correlation_results: Dict[str, "CorrelationResult"]) -> Dict[str, Any]:
         """Find the strongest correlation result."""
         if not correlation_results:
             return {}
         
-        strongest = max(correlation_results.values(), key=lambda x: abs(x.effect_size))
+        # Manual scan keeps max()'s semantics (first result wins ties and a
+        # leading NaN is never displaced) without a key lambda per result
+        results = iter(correlation_results.values())
+        strongest = next(results)
+        strongest_abs = abs(strongest.effect_size)
+        for result in results:
+            effect_abs = abs(result.effect_size)
+            if effect_abs > strongest_abs:
+                strongest_abs = effect_abs
+                strongest = result
         
         return {
             'metric_name': strongest.metric_name,
@@ -469,13 +662,31 @@ class CoachingEngine(LoggingMixin):
         
         return advice
     
-    def _generate_overview(self, prioritized_insights: List[CoachingInsight]) -> str:
+    def _tally_insights(self, insights: List[CoachingInsight]) -> _InsightTally:
+        """Collect the report's summary counts in a single pass over the insights."""
+        high_confidence = 0
+        actionable = 0
+        correlation = 0
+        first_high_priority_metric = None
+        
+        for insight in insights:
+            if insight.confidence_level == 'high':
+                high_confidence += 1
+            if insight.actionable_advice:
+                actionable += 1
+            if insight.insight_type == "correlation":
+                correlation += 1
+            if first_high_priority_metric is None and insight.priority_score >= 70:
+                first_high_priority_metric = insight.metric_name
+        
+        return _InsightTally(high_confidence, actionable, correlation, first_high_priority_metric)
+    
+    def _generate_overview(self, prioritized_insights: List[CoachingInsight], correlation_count: int) -> str:
         """Generate an overview of the analysis."""
         if not prioritized_insights:
             return "No significant insights found. Continue playing to gather more data."
         
         top_insight = prioritized_insights[0]
-        correlation_count = len([i for i in prioritized_insights if i.insight_type == "correlation"])
         
         overview = f"Your strongest improvement opportunity is {top_insight.metric_name}."
         
@@ -490,12 +701,17 @@ class CoachingEngine(LoggingMixin):
     
     def _consolidate_training_recommendations(self, insights: List[CoachingInsight]) -> List[str]:
         """Consolidate training pack recommendations."""
-        recommendations = set()
-        for insight in insights:
-            recommendations.update(insight.training_recommendations)
-        return list(recommendations)[:5]  # Top 5
+        # dict.fromkeys de-duplicates while keeping first-seen order
+        recommendations = dict.fromkeys(
+            chain.from_iterable(insight.training_recommendations for insight in insights)
+        )
+        return list(islice(recommendations, 5))  # Top 5
     
-    def _generate_next_steps(self, games_data: List[Dict[str, Any]], insights: List[CoachingInsight]) -> List[str]:
+    def _generate_next_steps(
+        self,
+        games_data: List[Dict[str, Any]],
+        high_priority_metric: Optional[str]
+    ) -> List[str]:
         """Generate next steps for the player."""
         steps = []
         
@@ -504,9 +720,8 @@ class CoachingEngine(LoggingMixin):
             steps.append("Continue playing ranked games to improve analysis accuracy")
         
         # Focus area steps
-        high_priority = [i for i in insights if i.priority_score >= 70]
-        if high_priority:
-            steps.append(f"Focus on improving {high_priority[0].metric_name}")
+        if high_priority_metric is not None:
+            steps.append(f"Focus on improving {high_priority_metric}")
         
         # Training steps
         steps.append("Practice in training packs for 15-20 minutes before ranked sessions")
@@ -1,8 +1,13 @@
 """Metric definitions and benchmarks for Rocket League coaching analysis."""
 
-from typing import Dict, Any, List, NamedTuple
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Any, FrozenSet, Tuple
 from enum import Enum
 
+import numpy as np
+
 
 class MetricTier(Enum):
     """Metric confidence tiers based on causation evidence."""
@@ -11,8 +16,21 @@ class MetricTier(Enum):
     TIER_3 = "correlation_only"  # Team-dependent, correlation analysis only
 
 
-class MetricDefinition(NamedTuple):
+@dataclass(frozen=True)
+class MetricDefinition:
     """Definition of a performance metric."""
+    # Declared by hand rather than with slots=True, which needs Python 3.10
+    __slots__ = (
+        'name',
+        'display_name',
+        'description',
+        'tier',
+        'unit',
+        'format_string',
+        'higher_is_better',
+        'calculation_method',
+    )
+    
     name: str
     display_name: str
     description: str
@@ -21,6 +39,15 @@ class MetricDefinition(NamedTuple):
     format_string: str  # For display formatting
     higher_is_better: bool
     calculation_method: str  # Description of how it's calculated
+    
+    # Without a __dict__, the default pickle/copy protocol restores slots with
+    # setattr, which the frozen dataclass rejects (slots=True adds these too)
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
 
 # Core MVP Metrics Framework (12 metrics total)
@@ -161,6 +188,28 @@ METRIC_DEFINITIONS = {
     ),
 }
 
+# Metric name and tier groupings, fixed once METRIC_DEFINITIONS is built
+_ALL_METRIC_NAMES: Tuple[str, ...] = tuple(METRIC_DEFINITIONS)
+_VALID_METRIC_NAMES: FrozenSet[str] = frozenset(METRIC_DEFINITIONS)
+_METRICS_BY_TIER: Dict[MetricTier, Tuple[MetricDefinition, ...]] = {
+    tier: tuple(defn for defn in METRIC_DEFINITIONS.values() if defn.tier is tier)
+    for tier in MetricTier
+}
+_TIER_METRIC_NAMES: Dict[MetricTier, Tuple[str, ...]] = {
+    tier: tuple(name for name, defn in METRIC_DEFINITIONS.items() if defn.tier is tier)
+    for tier in MetricTier
+}
+
+# Valid (lower, upper) range for each metric's value, used when cleaning
+# extracted values. Percentages and boost levels are capped at 100; every
+# other metric only needs to be non-negative.
+DEFAULT_VALUE_BOUNDS: Tuple[float, float] = (0.0, math.inf)
+_PERCENT_SCALE_METRICS = ("shooting_percentage", "avg_amount")
+METRIC_VALUE_BOUNDS: Dict[str, Tuple[float, float]] = {
+    name: (0.0, 100.0) if name in _PERCENT_SCALE_METRICS else DEFAULT_VALUE_BOUNDS
+    for name in METRIC_DEFINITIONS
+}
+
 
 # Rank-based performance benchmarks
 RANK_BENCHMARKS = {
@@ -237,6 +286,7 @@ RANK_BENCHMARKS = {
 }
 
 
+@lru_cache(maxsize=None)
 def get_metric_definition(metric_name: str) -> MetricDefinition:
     """Get metric definition by name."""
     if metric_name not in METRIC_DEFINITIONS:
@@ -244,13 +294,48 @@ def get_metric_definition(metric_name: str) -> MetricDefinition:
     return METRIC_DEFINITIONS[metric_name]
 
 
-def get_metrics_by_tier(tier: MetricTier) -> List[MetricDefinition]:
+def get_metrics_by_tier(tier: MetricTier) -> Tuple[MetricDefinition, ...]:
     """Get all metrics for a specific tier."""
-    return [metric for metric in METRIC_DEFINITIONS.values() if metric.tier == tier]
+    return _METRICS_BY_TIER[tier]
+
+
+# Benchmarks flattened into a (rank, metric, threshold) array. Metrics follow
+# get_all_metric_names() order, thresholds follow BENCHMARK_THRESHOLDS, and
+# metrics without a benchmark are zero, matching get_rank_benchmark's default.
+BENCHMARK_THRESHOLDS: Tuple[str, ...] = ("min", "avg", "good")
+_RANK_INDEX: Dict[str, int] = {rank: index for index, rank in enumerate(RANK_BENCHMARKS)}
+
+
+def _build_benchmark_array() -> np.ndarray:
+    """Build the read-only (rank, metric, threshold) benchmark array."""
+    array = np.zeros(
+        (len(RANK_BENCHMARKS), len(_ALL_METRIC_NAMES), len(BENCHMARK_THRESHOLDS)),
+        dtype=np.float64
+    )
+    for rank, rank_index in _RANK_INDEX.items():
+        for metric_index, metric_name in enumerate(_ALL_METRIC_NAMES):
+            benchmark = RANK_BENCHMARKS[rank].get(metric_name)
+            if benchmark is not None:
+                array[rank_index, metric_index] = [
+                    benchmark[threshold] for threshold in BENCHMARK_THRESHOLDS
+                ]
+    array.setflags(write=False)
+    return array
+
+
+_BENCHMARK_ARRAY = _build_benchmark_array()
+
+
+@lru_cache(maxsize=64)
+def get_rank_benchmark_array(rank: str) -> np.ndarray:
+    """Get all benchmarks for a rank as a read-only (metrics, thresholds) array."""
+    rank = rank.lower().replace(" ", "_")
+    # Default to platinum if rank not found
+    return _BENCHMARK_ARRAY[_RANK_INDEX.get(rank, _RANK_INDEX["platinum"])]
 
 
 def get_rank_benchmark(rank: str, metric_name: str) -> Dict[str, float]:
-    """Get benchmark values for a specific rank and metric."""
+    """Get benchmark values for a specific rank and metric, as a new dict."""
     rank = rank.lower().replace(" ", "_")
     if rank not in RANK_BENCHMARKS:
         # Default to platinum if rank not found
@@ -259,44 +344,54 @@ def get_rank_benchmark(rank: str, metric_name: str) -> Dict[str, float]:
     if metric_name not in RANK_BENCHMARKS[rank]:
         return {"min": 0, "avg": 0, "good": 0}
     
-    return RANK_BENCHMARKS[rank][metric_name]
+    return dict(RANK_BENCHMARKS[rank][metric_name])
+
+
+# Bound str.format for each metric's format string, and whether it shows a percentage
+_METRIC_FORMATTERS: Dict[str, Tuple[Callable[..., str], bool]] = {
+    name: (defn.format_string.format, "%" in defn.format_string)
+    for name, defn in METRIC_DEFINITIONS.items()
+}
 
 
 def format_metric_value(metric_name: str, value: float, game_duration: float = None) -> str:
     """Format a metric value for display."""
-    definition = get_metric_definition(metric_name)
+    formatter = _METRIC_FORMATTERS.get(metric_name)
+    if formatter is None:
+        raise ValueError(f"Unknown metric: {metric_name}")
     
-    if "%" in definition.format_string and game_duration:
+    format_value, shows_percentage = formatter
+    if shows_percentage and game_duration:
         # Calculate percentage for time-based metrics
         percentage = (value / game_duration) * 100 if game_duration > 0 else 0
-        return definition.format_string.format(value, percentage)
+        return format_value(value, percentage)
     else:
-        return definition.format_string.format(value)
+        return format_value(value)
 
 
-def get_all_metric_names() -> List[str]:
-    """Get list of all available metric names."""
-    return list(METRIC_DEFINITIONS.keys())
+def get_all_metric_names() -> Tuple[str, ...]:
+    """Get all available metric names."""
+    return _ALL_METRIC_NAMES
 
 
-def get_tier_1_metrics() -> List[str]:
-    """Get list of Tier 1 (high confidence) metric names."""
-    return [name for name, defn in METRIC_DEFINITIONS.items() if defn.tier == MetricTier.TIER_1]
+def get_tier_1_metrics() -> Tuple[str, ...]:
+    """Get Tier 1 (high confidence) metric names."""
+    return _TIER_METRIC_NAMES[MetricTier.TIER_1]
 
 
-def get_tier_2_metrics() -> List[str]:
-    """Get list of Tier 2 (medium confidence) metric names."""
-    return [name for name, defn in METRIC_DEFINITIONS.items() if defn.tier == MetricTier.TIER_2]
+def get_tier_2_metrics() -> Tuple[str, ...]:
+    """Get Tier 2 (medium confidence) metric names."""
+    return _TIER_METRIC_NAMES[MetricTier.TIER_2]
 
 
-def get_tier_3_metrics() -> List[str]:
-    """Get list of Tier 3 (correlation only) metric names."""
-    return [name for name, defn in METRIC_DEFINITIONS.items() if defn.tier == MetricTier.TIER_3]
+def get_tier_3_metrics() -> Tuple[str, ...]:
+    """Get Tier 3 (correlation only) metric names."""
+    return _TIER_METRIC_NAMES[MetricTier.TIER_3]
 
 
 def is_valid_metric(metric_name: str) -> bool:
     """Check if a metric name is valid."""
-    return metric_name in METRIC_DEFINITIONS
+    return metric_name in _VALID_METRIC_NAMES
 
 
 def get_metric_display_info(metric_name: str) -> Dict[str, Any]:
@@ -1,13 +1,16 @@
 """Metrics extraction from Rocket League replays using carball analysis."""
 
+import logging
+import math
 import numpy as np
-from typing import Dict, Any, Optional, List
+from operator import attrgetter
+from typing import Callable, Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
 from carball.generated.api.game_pb2 import Game as ProtoGame
 from carball.generated.api.player_pb2 import Player
 
-from ..logging_config import get_logger, log_performance, LoggingMixin
+from ..logging_config import get_logger, LoggingMixin
 from .exceptions import (
     MetricsExtractionException,
     PlayerNotFoundException,
@@ -16,8 +19,74 @@ from .exceptions import (
 from .metrics_definitions import (
     get_all_metric_names,
     get_metric_definition,
-    is_valid_metric,
     METRIC_DEFINITIONS,
+    METRIC_VALUE_BOUNDS,
+    DEFAULT_VALUE_BOUNDS,
+)
+
+
+# (metric name, compiled attribute path getter) pairs
+_MetricPaths = Tuple[Tuple[str, Callable[[Any], Any]], ...]
+
+# Dotted attribute paths from a carball Player to each metric, grouped by tier.
+# Metrics named with a leading underscore are inputs to derived metrics.
+_METRIC_ATTRIBUTE_PATHS: Tuple[Tuple[str, str], ...] = (
+    # Tier 1 (high confidence)
+    ('avg_speed', 'stats.speed.average_speed'),
+    ('time_supersonic_speed', 'stats.speed.time_at_supersonic'),
+    ('avg_amount', 'stats.boost.average_boost_level'),
+    ('time_zero_boost', 'stats.boost.time_zero_boost'),
+    ('time_defensive_third', 'stats.positioning.time_defensive_third'),
+    ('_goals', 'goals'),
+    ('_shots', 'shots'),
+    # Tier 2 (medium confidence)
+    ('avg_distance_to_ball', 'stats.positioning.average_distance_to_ball'),
+    ('time_behind_ball', 'stats.positioning.time_behind_ball'),
+    ('amount_overfill', 'stats.boost.wasted_collection'),
+    ('saves', 'saves'),
+    # Tier 3 (correlation only)
+    ('time_most_back', 'stats.positioning.time_most_back'),
+    ('assists', 'assists'),
+)
+
+_METRIC_PATHS: _MetricPaths = tuple(
+    (metric_name, attrgetter(path)) for metric_name, path in _METRIC_ATTRIBUTE_PATHS
+)
+
+
+def _build_fused_extractor(
+    attribute_paths: Tuple[Tuple[str, str], ...]
+) -> Callable[[Any, Dict[str, float]], None]:
+    """Generate one straight-line function that reads every attribute path.
+    
+    The paths are fixed by the carball schema, so the table walk is unrolled
+    into plain attribute accesses and compiled once at import time.
+    """
+    lines = ['def _extract_fused(player, metrics):']
+    for metric_name, path in attribute_paths:
+        if not all(part.isidentifier() for part in path.split('.')):
+            raise ValueError(f"Invalid attribute path for {metric_name}: {path!r}")
+        lines.extend([
+            '    try:',
+            f'        metrics[{metric_name!r}] = player.{path}',
+            '    except AttributeError:',
+            f'        metrics[{metric_name!r}] = 0.0',
+        ])
+    
+    namespace: Dict[str, Any] = {}
+    exec(compile('\n'.join(lines), '<fused metric extractor>', 'exec'), namespace)
+    return namespace['_extract_fused']
+
+
+# Fused equivalent of walking _METRIC_PATHS with _extract_from_paths
+_extract_fused = _build_fused_extractor(_METRIC_ATTRIBUTE_PATHS)
+
+# Paths each metric needs, so subsets can be extracted without the full table
+_METRIC_PATHS_BY_NAME: Dict[str, _MetricPaths] = {
+    entry[0]: (entry,) for entry in _METRIC_PATHS if not entry[0].startswith('_')
+}
+_METRIC_PATHS_BY_NAME['shooting_percentage'] = tuple(
+    entry for entry in _METRIC_PATHS if entry[0] in ('_goals', '_shots')
 )
 
 
@@ -26,242 +95,210 @@ class MetricsExtractor(LoggingMixin):
     
     def __init__(self):
         self.supported_metrics = get_all_metric_names()
+        self._supported_set = frozenset(self.supported_metrics)
+        self._player_index: Tuple[Optional[ProtoGame], Dict[str, Player]] = (None, {})
+        # Metrics from extract_all_players, keyed by id() of the indexed players.
+        # Each entry keeps its player alive and is checked by identity, since
+        # ids of discarded wrappers can be reused by other players.
+        self._player_metrics: Tuple[
+            Optional[ProtoGame], Dict[int, Tuple[Player, Dict[str, float]]]
+        ] = (None, {})
     
     def extract_mvp_metrics(self, proto_game: ProtoGame, player_name: str) -> Dict[str, float]:
         """Extract all 12 MVP metrics for a specific player."""
-        with log_performance(f"extract_metrics_{player_name}"):
-            try:
-                # Find the target player
-                player = self._find_player(proto_game, player_name)
-                if not player:
-                    raise PlayerNotFoundException(player_name)
-                
-                # Extract all metrics
-                metrics = {}
-                
-                # Game duration for percentage calculations
-                game_duration = self._get_game_duration(proto_game)
-                
-                # Tier 1 Metrics (High Confidence)
-                metrics.update(self._extract_tier_1_metrics(proto_game, player, game_duration))
-                
-                # Tier 2 Metrics (Medium Confidence)
-                metrics.update(self._extract_tier_2_metrics(proto_game, player, game_duration))
-                
-                # Tier 3 Metrics (Correlation Only)
-                metrics.update(self._extract_tier_3_metrics(proto_game, player, game_duration))
-                
-                # Validate all metrics were extracted
-                missing_metrics = set(self.supported_metrics) - set(metrics.keys())
-                if missing_metrics:
-                    self.logger.warning(
-                        "Some metrics could not be extracted",
-                        player=player_name,
-                        missing=list(missing_metrics)
-                    )
-                
-                # Clean and validate metric values
-                cleaned_metrics = self._clean_metric_values(metrics)
-                
+        try:
+            # Find the target player
+            player = self._find_player(proto_game, player_name)
+            if not player:
+                raise PlayerNotFoundException(player_name)
+            
+            # Reuse metrics already extracted for this game by extract_all_players
+            cached_game, cached_metrics = self._player_metrics
+            if cached_game is proto_game:
+                cached_player, metrics = cached_metrics.get(id(player), (None, None))
+                if cached_player is player:
+                    return dict(metrics)
+            
+            # Extract all metrics into a dict preallocated with every MVP metric,
+            # so none can be missing
+            metrics = self._extract_player_metrics(
+                player, metrics=dict.fromkeys(self.supported_metrics, 0.0)
+            )
+            
+            # Clean and validate metric values
+            cleaned_metrics = self._clean_metric_values(metrics)
+            
+            # Skip building the log arguments when INFO is disabled
+            if self.logger.isEnabledFor(logging.INFO):
                 self.logger.info(
                     "Metrics extraction completed",
                     player=player_name,
                     metrics_count=len(cleaned_metrics),
-                    game_duration=game_duration
+                    game_duration=self._get_game_duration(proto_game)
                 )
-                
-                return cleaned_metrics
             
-            except Exception as e:
-                if isinstance(e, (PlayerNotFoundException, MetricsExtractionException)):
-                    raise
-                
-                self.logger.error(
-                    "Metrics extraction failed",
-                    player=player_name,
-                    error=str(e),
-                    error_type=type(e).__name__
-                )
-                raise MetricsExtractionException(
-                    f"Failed to extract metrics for {player_name}: {e}"
+            return cleaned_metrics
+        
+        except Exception as e:
+            if isinstance(e, (PlayerNotFoundException, MetricsExtractionException)):
+                raise
+            
+            self.logger.error(
+                "Metrics extraction failed",
+                player=player_name,
+                error=str(e),
+                error_type=type(e).__name__
+            )
+            raise MetricsExtractionException(
+                f"Failed to extract metrics for {player_name}: {e}"
+            )
+    
+    def extract_all_players(self, proto_game: ProtoGame) -> Dict[str, Dict[str, float]]:
+        """Extract all 12 MVP metrics for every named player in one pass.
+        
+        Results are kept for the game so later extract_mvp_metrics calls for
+        any of its players skip re-extraction.
+        
+        Returns:
+            Dictionary mapping player names to their cleaned metrics
+        """
+        try:
+            all_metrics = {}
+            metrics_by_player = {}
+            for player in self._get_players_by_name(proto_game).values():
+                metrics = self._clean_metric_values(self._extract_player_metrics(
+                    player, metrics=dict.fromkeys(self.supported_metrics, 0.0)
+                ))
+                metrics_by_player[id(player)] = (player, metrics)
+                all_metrics[player.name] = dict(metrics)
+            
+            self._player_metrics = (proto_game, metrics_by_player)
+            
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "Metrics extraction completed for all players",
+                    players_count=len(all_metrics),
+                    game_duration=self._get_game_duration(proto_game)
                 )
+            
+            return all_metrics
+        
+        except Exception as e:
+            self.logger.error(
+                "Metrics extraction failed",
+                error=str(e),
+                error_type=type(e).__name__
+            )
+            raise MetricsExtractionException(f"Failed to extract metrics for all players: {e}")
     
     def _find_player(self, proto_game: ProtoGame, player_name: str) -> Optional[Player]:
-        """Find player in game data."""
+        """Find player in game data.
+        
+        An exact (case-insensitive) name match wins; otherwise the first player
+        whose name contains, or is contained in, the target is returned.
+        """
         if not proto_game.players:
             return None
         
-        normalized_target = player_name.lower().strip()
+        players_by_name = self._get_players_by_name(proto_game)
+        normalized_target = player_name.casefold().strip()
         
-        for player in proto_game.players:
-            if not player.name:
-                continue
-            
-            normalized_player = player.name.lower().strip()
-            
-            if normalized_player == normalized_target:
-                return player
-            
-            # Partial match for platform names
-            if normalized_target in normalized_player or normalized_player in normalized_target:
-                return player
+        player = players_by_name.get(normalized_target)
+        if player is not None:
+            return player
+        
+        # Partial match for platform names
+        return next(
+            (
+                player for normalized_player, player in players_by_name.items()
+                if normalized_target in normalized_player or normalized_player in normalized_target
+            ),
+            None
+        )
+    
+    def _get_players_by_name(self, proto_game: ProtoGame) -> Dict[str, Player]:
+        """Map normalized player names to players, cached for the most recent game.
         
-        return None
+        Protobuf messages are unhashable, so the cache holds a single game and
+        checks identity rather than keying on id(), which can be reused.
+        """
+        cached_game, players_by_name = self._player_index
+        if cached_game is not proto_game:
+            players_by_name = {}
+            for player in proto_game.players:
+                if player.name:
+                    players_by_name.setdefault(player.name.casefold().strip(), player)
+            self._player_index = (proto_game, players_by_name)
+        return players_by_name
     
     def _get_game_duration(self, proto_game: ProtoGame) -> float:
         """Get game duration in seconds."""
         try:
-            if hasattr(proto_game, 'game_info') and proto_game.game_info:
-                return float(getattr(proto_game.game_info, 'length', 0))
-            return 0.0
-        except:
+            if not proto_game.HasField('game_info'):
+                return 0.0
+        except ValueError:
+            # game_info is not a field of this schema version
             return 0.0
+        
+        # Typed protobuf field; unset scalars read as 0
+        return float(proto_game.game_info.length)
     
-    def _extract_tier_1_metrics(self, proto_game: ProtoGame, player: Player, game_duration: float) -> Dict[str, float]:
-        """Extract Tier 1 (high confidence) metrics."""
-        metrics = {}
+    def _extract_player_metrics(
+        self,
+        player: Player,
+        paths: _MetricPaths = _METRIC_PATHS,
+        metrics: Optional[Dict[str, float]] = None
+    ) -> Dict[str, float]:
+        """Extract the metrics read from player stats, plus derived metrics.
+        
+        Values are written into ``metrics`` when given, otherwise into a new dict.
+        """
+        if metrics is None:
+            metrics = {}
         
         try:
-            # avg_speed: Average movement speed
-            if hasattr(player, 'stats') and hasattr(player.stats, 'speed'):
-                speed_stats = player.stats.speed
-                if hasattr(speed_stats, 'average_speed'):
-                    metrics['avg_speed'] = float(speed_stats.average_speed)
-                else:
-                    metrics['avg_speed'] = 0.0
+            if paths is _METRIC_PATHS:
+                _extract_fused(player, metrics)
             else:
-                metrics['avg_speed'] = 0.0
-            
-            # time_supersonic_speed: Time at maximum speed (2300 uu/s)
-            if hasattr(player, 'stats') and hasattr(player.stats, 'speed'):
-                speed_stats = player.stats.speed
-                if hasattr(speed_stats, 'time_at_supersonic'):
-                    metrics['time_supersonic_speed'] = float(speed_stats.time_at_supersonic)
-                else:
-                    metrics['time_supersonic_speed'] = 0.0
-            else:
-                metrics['time_supersonic_speed'] = 0.0
+                self._extract_from_paths(player, paths, metrics)
             
             # shooting_percentage: Goals per shot
-            goals = float(getattr(player, 'goals', 0))
-            shots = float(getattr(player, 'shots', 0))
-            if shots > 0:
-                metrics['shooting_percentage'] = (goals / shots) * 100
-            else:
-                metrics['shooting_percentage'] = 0.0
-            
-            # avg_amount: Average boost level
-            if hasattr(player, 'stats') and hasattr(player.stats, 'boost'):
-                boost_stats = player.stats.boost
-                if hasattr(boost_stats, 'average_boost_level'):
-                    metrics['avg_amount'] = float(boost_stats.average_boost_level)
-                else:
-                    metrics['avg_amount'] = 0.0
-            else:
-                metrics['avg_amount'] = 0.0
-            
-            # time_zero_boost: Time spent at 0 boost
-            if hasattr(player, 'stats') and hasattr(player.stats, 'boost'):
-                boost_stats = player.stats.boost
-                if hasattr(boost_stats, 'time_zero_boost'):
-                    metrics['time_zero_boost'] = float(boost_stats.time_zero_boost)
-                else:
-                    metrics['time_zero_boost'] = 0.0
-            else:
-                metrics['time_zero_boost'] = 0.0
-            
-            # time_defensive_third: Time in defensive zone
-            if hasattr(player, 'stats') and hasattr(player.stats, 'positioning'):
-                pos_stats = player.stats.positioning
-                if hasattr(pos_stats, 'time_defensive_third'):
-                    metrics['time_defensive_third'] = float(pos_stats.time_defensive_third)
+            if '_shots' in metrics:
+                shots = metrics.pop('_shots')
+                goals = metrics.pop('_goals')
+                if shots > 0:
+                    metrics['shooting_percentage'] = (goals / shots) * 100
                 else:
-                    metrics['time_defensive_third'] = 0.0
-            else:
-                metrics['time_defensive_third'] = 0.0
-            
-        except Exception as e:
-            self.logger.warning(
-                "Error extracting Tier 1 metrics",
-                error=str(e),
-                player=player.name if player else "unknown"
-            )
-        
-        return metrics
-    
-    def _extract_tier_2_metrics(self, proto_game: ProtoGame, player: Player, game_duration: float) -> Dict[str, float]:
-        """Extract Tier 2 (medium confidence) metrics."""
-        metrics = {}
+                    metrics['shooting_percentage'] = 0.0
         
-        try:
-            # avg_distance_to_ball: Average distance from ball
-            if hasattr(player, 'stats') and hasattr(player.stats, 'positioning'):
-                pos_stats = player.stats.positioning
-                if hasattr(pos_stats, 'average_distance_to_ball'):
-                    metrics['avg_distance_to_ball'] = float(pos_stats.average_distance_to_ball)
-                else:
-                    metrics['avg_distance_to_ball'] = 0.0
-            else:
-                metrics['avg_distance_to_ball'] = 0.0
-            
-            # time_behind_ball: Time positioned behind ball
-            if hasattr(player, 'stats') and hasattr(player.stats, 'positioning'):
-                pos_stats = player.stats.positioning
-                if hasattr(pos_stats, 'time_behind_ball'):
-                    metrics['time_behind_ball'] = float(pos_stats.time_behind_ball)
-                else:
-                    metrics['time_behind_ball'] = 0.0
-            else:
-                metrics['time_behind_ball'] = 0.0
-            
-            # amount_overfill: Boost wasted through overfill
-            if hasattr(player, 'stats') and hasattr(player.stats, 'boost'):
-                boost_stats = player.stats.boost
-                if hasattr(boost_stats, 'wasted_collection'):
-                    metrics['amount_overfill'] = float(boost_stats.wasted_collection)
-                else:
-                    metrics['amount_overfill'] = 0.0
-            else:
-                metrics['amount_overfill'] = 0.0
-            
-            # saves: Total saves
-            metrics['saves'] = float(getattr(player, 'saves', 0))
-            
-        except Exception as e:
+        except (TypeError, ValueError, OverflowError) as e:
+            # Missing attributes are handled per path, so only the goals/shots
+            # arithmetic can fail on malformed values
             self.logger.warning(
-                "Error extracting Tier 2 metrics",
+                "Error extracting player metrics",
                 error=str(e),
                 player=player.name if player else "unknown"
             )
         
         return metrics
     
-    def _extract_tier_3_metrics(self, proto_game: ProtoGame, player: Player, game_duration: float) -> Dict[str, float]:
-        """Extract Tier 3 (correlation only) metrics."""
-        metrics = {}
-        
-        try:
-            # time_most_back: Time as last defender
-            if hasattr(player, 'stats') and hasattr(player.stats, 'positioning'):
-                pos_stats = player.stats.positioning
-                if hasattr(pos_stats, 'time_most_back'):
-                    metrics['time_most_back'] = float(pos_stats.time_most_back)
-                else:
-                    metrics['time_most_back'] = 0.0
-            else:
-                metrics['time_most_back'] = 0.0
-            
-            # assists: Total assists
-            metrics['assists'] = float(getattr(player, 'assists', 0))
-            
-        except Exception as e:
-            self.logger.warning(
-                "Error extracting Tier 3 metrics",
-                error=str(e),
-                player=player.name if player else "unknown"
-            )
+    def _extract_from_paths(
+        self,
+        player: Player,
+        paths: _MetricPaths,
+        metrics: Dict[str, float]
+    ) -> None:
+        """Read metrics through compiled attribute path getters into ``metrics``.
         
-        return metrics
+        Missing attributes anywhere along a path yield 0.0. Values keep their
+        protobuf numeric type (float stats, int counters); _clean_metric_values
+        converts them to float.
+        """
+        for metric_name, get_value in paths:
+            try:
+                metrics[metric_name] = get_value(player)
+            except AttributeError:
+                metrics[metric_name] = 0.0
     
     def _clean_metric_values(self, metrics: Dict[str, float]) -> Dict[str, float]:
         """Clean and validate metric values."""
@@ -274,18 +311,15 @@ class MetricsExtractor(LoggingMixin):
                     clean_value = float(value)
                     
                     # Handle NaN and infinity
-                    if np.isnan(clean_value) or np.isinf(clean_value):
+                    if not math.isfinite(clean_value):
                         clean_value = 0.0
                     
-                    # Apply reasonable bounds
-                    if metric_name == 'shooting_percentage':
-                        clean_value = max(0.0, min(100.0, clean_value))
-                    elif metric_name in ['avg_amount']:
-                        clean_value = max(0.0, min(100.0, clean_value))
-                    elif 'time_' in metric_name:
-                        clean_value = max(0.0, clean_value)
-                    else:
-                        clean_value = max(0.0, clean_value)
+                    # Apply reasonable bounds (<= also maps -0.0 to 0.0)
+                    lower, upper = METRIC_VALUE_BOUNDS.get(metric_name, DEFAULT_VALUE_BOUNDS)
+                    if clean_value <= lower:
+                        clean_value = lower
+                    elif clean_value > upper:
+                        clean_value = upper
                     
                     cleaned[metric_name] = clean_value
                 else:
@@ -316,18 +350,43 @@ class MetricsExtractor(LoggingMixin):
     ) -> Dict[str, float]:
         """Extract only specific metrics."""
         # Validate metric names
-        invalid_metrics = [name for name in metric_names if not is_valid_metric(name)]
+        supported = self._supported_set
+        invalid_metrics = [name for name in metric_names if name not in supported]
         if invalid_metrics:
             raise InvalidMetricException(
                 f"Invalid metrics: {invalid_metrics}",
                 available_metrics=self.supported_metrics
             )
         
-        # Extract all metrics first (more efficient than extracting individually)
-        all_metrics = self.extract_mvp_metrics(proto_game, player_name)
+        try:
+            player = self._find_player(proto_game, player_name)
+            if not player:
+                raise PlayerNotFoundException(player_name)
+            
+            # Only walk the attribute paths the requested metrics need
+            paths = tuple(
+                path
+                for name in dict.fromkeys(metric_names)
+                for path in _METRIC_PATHS_BY_NAME[name]
+            )
+            metrics = self._clean_metric_values(self._extract_player_metrics(player, paths))
         
+        except Exception as e:
+            if isinstance(e, (PlayerNotFoundException, MetricsExtractionException)):
+                raise
+            
+            self.logger.error(
+                "Metrics extraction failed",
+                player=player_name,
+                error=str(e),
+                error_type=type(e).__name__
+            )
+            raise MetricsExtractionException(
+                f"Failed to extract metrics for {player_name}: {e}"
+            )
+
         # Return only requested metrics
-        return {name: all_metrics.get(name, 0.0) for name in metric_names}
+        return {name: metrics.get(name, 0.0) for name in metric_names}
     
     def validate_extracted_metrics(self, metrics: Dict[str, float]) -> Dict[str, Any]:
         """Validate extracted metrics and return validation report."""
@@ -341,24 +400,22 @@ class MetricsExtractor(LoggingMixin):
         }
         
         # Check for missing core metrics
-        expected_metrics = set(self.supported_metrics)
-        actual_metrics = set(metrics.keys())
-        missing = expected_metrics - actual_metrics
+        missing = self._supported_set - metrics.keys()
         
         if missing:
             validation['missing_metrics'] = list(missing)
             validation['warnings'].append(f"Missing metrics: {missing}")
         
-        # Check for invalid values
+        # Check for invalid values (exact floats, the common case, skip the isinstance check)
         for metric_name, value in metrics.items():
-            if not isinstance(value, (int, float)):
+            if type(value) is not float and not isinstance(value, (int, float)):
                 validation['invalid_values'].append({
                     'metric': metric_name,
                     'value': value,
                     'issue': 'not_numeric'
                 })
                 validation['valid'] = False
-            elif np.isnan(value) or np.isinf(value):
+            elif not math.isfinite(value):
                 validation['invalid_values'].append({
                     'metric': metric_name,
                     'value': value,
@@ -1,24 +1,327 @@
 """Player statistics analyzer using Ballchasing API."""
 
+import asyncio
+import hashlib
+import json
 import os
-from typing import Dict, List, Any, Optional, Tuple
-from collections import defaultdict
-import requests
+import time
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple, Union
+from functools import lru_cache
+import aiohttp
 import logging
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Ballchasing allows 2 calls per second for regular accounts
+DEFAULT_REQUESTS_PER_MINUTE = 120
+MAX_CONCURRENT_REQUESTS = 8
+MAX_RATE_LIMIT_RETRIES = 3
+
+DEFAULT_CACHE_DIR = 'data/cache/ballchasing'
+# Replay lists change as new games are uploaded; replay details never change
+REPLAY_LIST_TTL_SECONDS = 300
+
+# Response cache modes: read and write, read only (a miss is an error), or off
+CACHE_ENABLED = 'enabled'
+CACHE_REPLAY = 'replay'
+CACHE_DISABLED = 'disabled'
+CACHE_MODES = (CACHE_ENABLED, CACHE_REPLAY, CACHE_DISABLED)
+
+# Errors that make analyze_player skip a replay whose details could not be fetched
+REPLAY_FETCH_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, LookupError, ValueError)
+
+# Ballchasing per-player stat categories aggregated by analyze_player
+STAT_CATEGORIES = ('core', 'boost', 'movement', 'positioning', 'demo')
+
+# format_stats_display layout: (category, section title, rows), where each row
+# is (label, stat key, format spec, suffix)
+STAT_DISPLAY_SECTIONS = (
+    ('core', 'Core Stats (per game)', (
+        ('Goals', 'goals', '.2f', ''),
+        ('Assists', 'assists', '.2f', ''),
+        ('Saves', 'saves', '.2f', ''),
+        ('Shots', 'shots', '.2f', ''),
+        ('Score', 'score', '.0f', ''),
+        ('MVPs', 'mvp', '.2f', ''),
+    )),
+    ('boost', 'Boost Stats (per game)', (
+        ('Boost Used', 'amount_used', '.0f', ''),
+        ('Boost Collected', 'amount_collected', '.0f', ''),
+        ('Boost Stolen', 'amount_stolen', '.0f', ''),
+    )),
+    ('movement', 'Movement Stats (per game)', (
+        ('Total Distance', 'total_distance', '.0f', ''),
+        ('Time Supersonic Speed', 'time_supersonic_speed', '.1f', 's'),
+        ('Time Boost Speed', 'time_boost_speed', '.1f', 's'),
+        ('Time Slow Speed', 'time_slow_speed', '.1f', 's'),
+        ('Time on Ground', 'time_ground', '.1f', 's'),
+        ('Time in Air (Low)', 'time_low_air', '.1f', 's'),
+        ('Time in Air (High)', 'time_high_air', '.1f', 's'),
+    )),
+    ('positioning', 'Positioning Stats (per game)', (
+        ('Time Defensive Third', 'time_defensive_third', '.1f', 's'),
+        ('Time Neutral Third', 'time_neutral_third', '.1f', 's'),
+        ('Time Offensive Third', 'time_offensive_third', '.1f', 's'),
+        ('Time Behind Ball', 'time_behind_ball', '.1f', 's'),
+        ('Time In Front of Ball', 'time_infront_ball', '.1f', 's'),
+    )),
+    ('demo', 'Demolition Stats (per game)', (
+        ('Demolitions Inflicted', 'inflicted', '.2f', ''),
+        ('Demolitions Taken', 'taken', '.2f', ''),
+    )),
+)
+
+# Derived metrics from analyze_player shown at the end of a category's section
+DERIVED_DISPLAY_ROWS = {
+    'core': (
+        ('Shooting %', 'shooting_percentage', '.1f', '%'),
+    ),
+    'boost': (
+        ('Boost Efficiency', 'boost_efficiency', '.2f', ' actions/100 boost'),
+        ('Steal Ratio', 'steal_ratio', '.1f', '% of collected boost was stolen'),
+    ),
+}
+
+
+@lru_cache(maxsize=4096)
+def _per_hundred(amount: float, total: float) -> float:
+    """amount per 100 of total, or 0 when total is zero."""
+    if total == 0:
+        return 0
+    return (amount / total) * 100
+
+
+def _player_goals(player: Dict) -> float:
+    """Goals scored by a replay player entry, 0 if absent."""
+    return player.get('stats', {}).get('core', {}).get('goals', 0)
+
+
+def _sum_team_goals(team: Dict) -> float:
+    """Sum of goals scored by a team's players."""
+    return sum(map(_player_goals, team.get('players', ())))
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes, with orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Encode data as JSON bytes, with orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+class _StatTotals:
+    """Running per-category stat totals, one float64 vector per category.
+    
+    Columns are assigned to stats in first-seen order, so whatever stats
+    Ballchasing returns are kept; a stat missing from a replay counts as 0.
+    """
+    
+    __slots__ = ('columns', 'totals')
+    
+    def __init__(self):
+        self.columns: Dict[str, Dict[str, int]] = {}
+        self.totals: Dict[str, np.ndarray] = {}
+    
+    def add(self, category: str, category_stats: Dict[str, float]) -> None:
+        """Add one replay's stats for a category."""
+        if not category_stats:
+            return
+        
+        columns = self.columns.setdefault(category, {})
+        for stat in category_stats:
+            columns.setdefault(stat, len(columns))
+        
+        values = np.fromiter(
+            (category_stats.get(stat, 0) for stat in columns),
+            dtype=np.float64,
+            count=len(columns)
+        )
+        
+        totals = self.totals.get(category)
+        if totals is None:
+            totals = np.zeros(len(columns), dtype=np.float64)
+        elif len(totals) < len(columns):
+            # New stats appeared; earlier replays contributed 0 for them
+            totals = np.concatenate((totals, np.zeros(len(columns) - len(totals))))
+        totals += values
+        self.totals[category] = totals
+    
+    def averages(self, count: int) -> Dict[str, Dict[str, float]]:
+        """Per-category stat averages over count games."""
+        return {
+            category: dict(zip(self.columns[category], (totals / count).tolist()))
+            for category, totals in self.totals.items()
+        }
+
+
+class _TokenBucket:
+    """Token bucket that spaces out requests to stay under a per-minute quota."""
+    
+    __slots__ = ('rpm', 'tokens', 'last_update')
+    
+    def __init__(self, rpm: int):
+        self.rpm = rpm
+        self.tokens = float(rpm)
+        self.last_update = time.monotonic()
+    
+    async def acquire(self) -> None:
+        """Take one token, sleeping until it has been refilled if necessary.
+        
+        The token is reserved before sleeping (tokens may go negative), so
+        concurrent callers queue up behind each other without a lock.
+        """
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        self.last_update = now
+        self.tokens = min(float(self.rpm), self.tokens + elapsed * self.rpm / 60)
+        
+        self.tokens -= 1
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens * 60 / self.rpm)
+
+
+class _ReplayCache:
+    """On-disk JSON cache of Ballchasing responses keyed by SHA256(endpoint:id)."""
+    
+    __slots__ = ('cache_dir', 'mode')
+    
+    def __init__(self, cache_dir: Union[str, Path], mode: str = CACHE_ENABLED):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode: {mode}")
+        self.cache_dir = Path(cache_dir)
+        self.mode = mode
+    
+    @staticmethod
+    def key(endpoint: str, resource_id: str) -> str:
+        """Cache key for a resource of an endpoint."""
+        return hashlib.sha256(f"{endpoint}:{resource_id}".encode()).hexdigest()
+    
+    def get(self, key: str, ttl_seconds: Optional[float] = None) -> Optional[Any]:
+        """Return cached data, or None if absent, expired or the cache is disabled.
+        
+        Raises:
+            LookupError: On a miss in replay mode
+        """
+        if self.mode == CACHE_DISABLED:
+            return None
+        
+        path = self.cache_dir / f"{key}.json"
+        try:
+            # Replay mode reproduces earlier runs, so entries never expire
+            if (
+                ttl_seconds is not None
+                and self.mode == CACHE_ENABLED
+                and time.time() - path.stat().st_mtime > ttl_seconds
+            ):
+                return None
+            return _json_loads(path.read_bytes())
+        except (OSError, ValueError):
+            if self.mode == CACHE_REPLAY:
+                raise LookupError(f"No cached response for key {key} in replay mode")
+            return None
+    
+    def set(self, key: str, data: Any) -> None:
+        """Store data under key when the cache is writable."""
+        if self.mode != CACHE_ENABLED:
+            return
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self.cache_dir / f"{key}.json"
+            tmp_path = path.with_suffix('.tmp')
+            tmp_path.write_bytes(_json_dumps(data))
+            # Atomic rename so concurrent readers never see a partial file
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to cache Ballchasing response {key}: {e}")
+
+
 class PlayerStatsAnalyzer:
     """Analyzes player statistics from Ballchasing API."""
     
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize the analyzer with API key."""
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        requests_per_minute: Optional[int] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        cache_mode: str = CACHE_ENABLED
+    ):
+        """Initialize the analyzer with API key, request quota and response cache."""
         self.api_key = api_key or os.environ.get('BALLCHASING_API_KEY')
         if not self.api_key:
             raise ValueError("Ballchasing API key not provided")
         self.headers = {'Authorization': self.api_key}
+        rpm = requests_per_minute or int(
+            os.environ.get('BALLCHASING_RPM', DEFAULT_REQUESTS_PER_MINUTE)
+        )
+        self._bucket = _TokenBucket(rpm)
+        self._cache = _ReplayCache(
+            cache_dir or os.environ.get('BALLCHASING_CACHE_DIR', DEFAULT_CACHE_DIR),
+            cache_mode
+        )
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # Lowercased player name -> (team color, stats) for the last replay searched
+        self._roster_index: Tuple[Optional[Dict], Dict[str, Tuple[str, Dict]]] = (None, {})
+        # Replay detail fetches in progress, shared by concurrent callers
+        self._replay_fetches: Dict[str, asyncio.Task] = {}
     
-    def get_player_replays(self, username: str, count: int = 20) -> List[Dict]:
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=10)
+            )
+            # Created alongside the session so both belong to the running loop
+            self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        return self._session
+    
+    async def _get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET a Ballchasing endpoint under the rate limit, retrying on HTTP 429."""
+        session = await self._get_session()
+        
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            async with self._semaphore:
+                await self._bucket.acquire()
+                async with session.get(url, params=params) as response:
+                    if response.status != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                        response.raise_for_status()
+                        return _json_loads(await response.read())
+                    delay = self._retry_delay(response, attempt)
+            
+            logger.warning(f"Rate limited by Ballchasing, retrying {url} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _retry_delay(response: aiohttp.ClientResponse, attempt: int) -> float:
+        """Seconds to wait before retrying, from Retry-After or exponential backoff."""
+        try:
+            return max(0.0, float(response.headers['Retry-After']))
+        except (KeyError, ValueError):
+            return float(2 ** attempt)
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def get_player_replays(self, username: str, count: int = 20) -> List[Dict]:
         """Fetch recent replays for a player."""
         search_url = 'https://ballchasing.com/api/replays'
         params = {
@@ -26,38 +329,81 @@ class PlayerStatsAnalyzer:
             'count': count
         }
         
-        response = requests.get(search_url, headers=self.headers, params=params)
-        response.raise_for_status()
+        cache_key = self._cache.key('replays', f"{username}:{count}")
+        data = self._cache.get(cache_key, ttl_seconds=REPLAY_LIST_TTL_SECONDS)
+        if data is None:
+            data = await self._get_json(search_url, params=params)
+            self._cache.set(cache_key, data)
         
-        data = response.json()
         return data.get('list', [])
     
-    def get_replay_details(self, replay_id: str) -> Dict:
-        """Fetch detailed information for a specific replay."""
+    async def get_replay_details(self, replay_id: str) -> Dict:
+        """Fetch detailed information for a specific replay.
+        
+        Finished replays never change, so cached details are reused indefinitely.
+        Concurrent requests for the same replay (e.g. analyses of players who
+        shared a match) wait on a single HTTP request.
+        """
+        cache_key = self._cache.key('replay', replay_id)
+        replay = self._cache.get(cache_key)
+        if replay is not None:
+            return replay
+        
+        fetch = self._replay_fetches.get(replay_id)
+        if fetch is None:
+            fetch = asyncio.ensure_future(self._fetch_replay_details(replay_id, cache_key))
+            self._replay_fetches[replay_id] = fetch
+            fetch.add_done_callback(lambda _: self._replay_fetches.pop(replay_id, None))
+        
+        # Shielded so one caller being cancelled doesn't cancel the others' fetch
+        return await asyncio.shield(fetch)
+    
+    async def _fetch_replay_details(self, replay_id: str, cache_key: str) -> Dict:
+        """Download replay details and store them in the response cache."""
         replay_url = f'https://ballchasing.com/api/replays/{replay_id}'
-        response = requests.get(replay_url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        replay = await self._get_json(replay_url)
+        self._cache.set(cache_key, replay)
+        return replay
     
     def find_player_in_replay(self, replay: Dict, username: str) -> Tuple[Optional[str], Optional[Dict]]:
         """Find which team a player is on and their stats.
         
+        The roster of the most recently searched replay is indexed by name, so
+        repeated lookups in the same replay skip the team scans.
+        
         Returns:
             Tuple of (team_color, player_stats) or (None, None) if not found
         """
-        username_lower = username.lower()
-        
-        # Check blue team
-        for player in replay.get('blue', {}).get('players', []):
-            if player.get('name', '').lower() == username_lower:
-                return 'blue', player.get('stats', {})
-        
-        # Check orange team
-        for player in replay.get('orange', {}).get('players', []):
-            if player.get('name', '').lower() == username_lower:
-                return 'orange', player.get('stats', {})
+        cached_replay, roster = self._roster_index
+        if cached_replay is not replay:
+            roster = {}
+            # Blue is indexed first so it wins if a name appears on both teams
+            for team_color in ('blue', 'orange'):
+                for player in replay.get(team_color, {}).get('players', []):
+                    roster.setdefault(
+                        player.get('name', '').lower(),
+                        (team_color, player.get('stats', {}))
+                    )
+            self._roster_index = (replay, roster)
+        
+        return roster.get(username.lower(), (None, None))
+    
+    @staticmethod
+    def _summary_may_include_player(replay_summary: Dict, username_lower: str) -> bool:
+        """Check a search result's team rosters for the player.
         
-        return None, None
+        Replays whose summary has no roster are kept, since only the full
+        details can tell.
+        """
+        has_roster = False
+        for team_color in ('blue', 'orange'):
+            players = replay_summary.get(team_color, {}).get('players')
+            if players is None:
+                continue
+            has_roster = True
+            if any(player.get('name', '').lower() == username_lower for player in players):
+                return True
+        return not has_roster
     
     def determine_match_winner(self, replay: Dict) -> Tuple[int, int]:
         """Determine the final score of a match.
@@ -83,15 +429,9 @@ class PlayerStatsAnalyzer:
         
         # Method 3: Sum of player goals
         if blue_goals is None:
-            blue_goals = sum(
-                p.get('stats', {}).get('core', {}).get('goals', 0) 
-                for p in replay.get('blue', {}).get('players', [])
-            )
+            blue_goals = _sum_team_goals(replay.get('blue', {}))
         if orange_goals is None:
-            orange_goals = sum(
-                p.get('stats', {}).get('core', {}).get('goals', 0) 
-                for p in replay.get('orange', {}).get('players', [])
-            )
+            orange_goals = _sum_team_goals(replay.get('orange', {}))
         
         return blue_goals or 0, orange_goals or 0
     
@@ -114,27 +454,45 @@ class PlayerStatsAnalyzer:
             core_stats.get('saves', 0)
         )
         
-        return (useful_actions / boost_used) * 100
+        return _per_hundred(useful_actions, boost_used)
     
     def calculate_shooting_percentage(self, core_stats: Dict) -> float:
         """Calculate shooting percentage."""
-        shots = core_stats.get('shots', 0)
-        if shots == 0:
-            return 0
-        goals = core_stats.get('goals', 0)
-        return (goals / shots) * 100
+        return _per_hundred(core_stats.get('goals', 0), core_stats.get('shots', 0))
     
     def calculate_steal_ratio(self, boost_stats: Dict) -> float:
         """Calculate percentage of collected boost that was stolen."""
-        collected = boost_stats.get('amount_collected', 0)
-        if collected == 0:
-            return 0
-        stolen = boost_stats.get('amount_stolen', 0)
-        return (stolen / collected) * 100
+        return _per_hundred(
+            boost_stats.get('amount_stolen', 0), boost_stats.get('amount_collected', 0)
+        )
     
     def analyze_player(self, username: str, num_replays: int = 20) -> Dict[str, Any]:
         """Perform complete analysis of a player's recent performance.
         
+        Synchronous wrapper around analyze_player_async for callers without
+        an event loop.
+        
+        Args:
+            username: Player username to analyze
+            num_replays: Number of recent replays to analyze
+            
+        Returns:
+            Dictionary containing comprehensive player statistics
+        """
+        async def run() -> Dict[str, Any]:
+            try:
+                return await self.analyze_player_async(username, num_replays)
+            finally:
+                # The session is bound to this event loop, so it can't be reused
+                await self.close()
+        
+        return asyncio.run(run())
+    
+    async def analyze_player_async(self, username: str, num_replays: int = 20) -> Dict[str, Any]:
+        """Perform complete analysis of a player's recent performance.
+        
+        Replay details are fetched concurrently.
+        
         Args:
             username: Player username to analyze
             num_replays: Number of recent replays to analyze
@@ -144,18 +502,39 @@ class PlayerStatsAnalyzer:
         """
         logger.info(f"Analyzing player: {username}")
         
-        replays = self.get_player_replays(username, num_replays)
+        replays = await self.get_player_replays(username, num_replays)
         if not replays:
             logger.warning(f"No replays found for {username}")
             return {}
         
+        # Only fetch details for replays the player can be in
+        username_lower = username.lower()
+        candidates = []
+        for replay_summary in replays:
+            if self._summary_may_include_player(replay_summary, username_lower):
+                candidates.append(replay_summary)
+            else:
+                logger.debug(f"Player not found in replay {replay_summary['id']}")
+        
+        details = await asyncio.gather(
+            *(self.get_replay_details(replay_summary['id']) for replay_summary in candidates),
+            return_exceptions=True
+        )
+        
         # Initialize aggregation
-        stats = defaultdict(lambda: defaultdict(float))
+        stat_totals = _StatTotals()
         wins = losses = ties = total_games = 0
         
-        for replay_summary in replays:
+        for replay_summary, replay in zip(candidates, details):
+            if isinstance(replay, BaseException):
+                # Request failures, replay-mode cache misses and malformed JSON
+                # skip the replay; anything else is a bug and propagates
+                if not isinstance(replay, REPLAY_FETCH_ERRORS):
+                    raise replay
+                logger.error(f"Error fetching replay {replay_summary['id']}: {replay}")
+                continue
+            
             try:
-                replay = self.get_replay_details(replay_summary['id'])
                 player_team, player_stats = self.find_player_in_replay(replay, username)
                 
                 if not player_stats:
@@ -181,23 +560,18 @@ class PlayerStatsAnalyzer:
                         losses += 1
                 
                 # Aggregate stats by category
-                for category in ['core', 'boost', 'movement', 'positioning', 'demo']:
-                    category_stats = player_stats.get(category, {})
-                    for stat, value in category_stats.items():
-                        stats[category][stat] += value
+                for category in STAT_CATEGORIES:
+                    stat_totals.add(category, player_stats.get(category, {}))
                 
-            except Exception as e:
+            except (KeyError, TypeError, AttributeError, ValueError) as e:
+                # Unexpected shapes or values in the replay JSON
                 logger.error(f"Error processing replay {replay_summary['id']}: {e}")
                 continue
         
         # Calculate averages
-        if total_games > 0:
-            for category in stats:
-                for stat in stats[category]:
-                    stats[category][stat] /= total_games
+        stats_dict = stat_totals.averages(total_games) if total_games > 0 else {}
         
         # Calculate derived metrics
-        stats_dict = dict(stats)
         boost_efficiency = self.calculate_boost_efficiency(stats_dict)
         win_rate = (wins / total_games * 100) if total_games > 0 else 0
         
@@ -245,56 +619,21 @@ class PlayerStatsAnalyzer:
         lines.append(f"Record: {stats['wins']}W - {stats['losses']}L - {stats['ties']}T")
         lines.append(f"Win Rate: {stats['win_rate']:.1f}%")
         
-        if 'core' in stats['stats']:
-            lines.append("")
-            lines.append("--- Core Stats (per game) ---")
-            core = stats['stats']['core']
-            lines.append(f"Goals: {core.get('goals', 0):.2f}")
-            lines.append(f"Assists: {core.get('assists', 0):.2f}")
-            lines.append(f"Saves: {core.get('saves', 0):.2f}")
-            lines.append(f"Shots: {core.get('shots', 0):.2f}")
-            lines.append(f"Score: {core.get('score', 0):.0f}")
-            lines.append(f"MVPs: {core.get('mvp', 0):.2f}")
-            lines.append(f"Shooting %: {stats['shooting_percentage']:.1f}%")
-        
-        if 'boost' in stats['stats']:
-            lines.append("")
-            lines.append("--- Boost Stats (per game) ---")
-            boost = stats['stats']['boost']
-            lines.append(f"Boost Used: {boost.get('amount_used', 0):.0f}")
-            lines.append(f"Boost Collected: {boost.get('amount_collected', 0):.0f}")
-            lines.append(f"Boost Stolen: {boost.get('amount_stolen', 0):.0f}")
-            lines.append(f"Boost Efficiency: {stats['boost_efficiency']:.2f} actions/100 boost")
-            lines.append(f"Steal Ratio: {stats['steal_ratio']:.1f}% of collected boost was stolen")
-        
-        if 'movement' in stats['stats']:
-            lines.append("")
-            lines.append("--- Movement Stats (per game) ---")
-            movement = stats['stats']['movement']
-            lines.append(f"Total Distance: {movement.get('total_distance', 0):.0f}")
-            lines.append(f"Time Supersonic Speed: {movement.get('time_supersonic_speed', 0):.1f}s")
-            lines.append(f"Time Boost Speed: {movement.get('time_boost_speed', 0):.1f}s")
-            lines.append(f"Time Slow Speed: {movement.get('time_slow_speed', 0):.1f}s")
-            lines.append(f"Time on Ground: {movement.get('time_ground', 0):.1f}s")
-            lines.append(f"Time in Air (Low): {movement.get('time_low_air', 0):.1f}s")
-            lines.append(f"Time in Air (High): {movement.get('time_high_air', 0):.1f}s")
-        
-        if 'positioning' in stats['stats']:
-            lines.append("")
-            lines.append("--- Positioning Stats (per game) ---")
-            positioning = stats['stats']['positioning']
-            lines.append(f"Time Defensive Third: {positioning.get('time_defensive_third', 0):.1f}s")
-            lines.append(f"Time Neutral Third: {positioning.get('time_neutral_third', 0):.1f}s")
-            lines.append(f"Time Offensive Third: {positioning.get('time_offensive_third', 0):.1f}s")
-            lines.append(f"Time Behind Ball: {positioning.get('time_behind_ball', 0):.1f}s")
-            lines.append(f"Time In Front of Ball: {positioning.get('time_infront_ball', 0):.1f}s")
-        
-        if 'demo' in stats['stats']:
+        category_stats = stats['stats']
+        for category, title, rows in STAT_DISPLAY_SECTIONS:
+            if category not in category_stats:
+                continue
+            values = category_stats[category]
             lines.append("")
-            lines.append("--- Demolition Stats (per game) ---")
-            demo = stats['stats']['demo']
-            lines.append(f"Demolitions Inflicted: {demo.get('inflicted', 0):.2f}")
-            lines.append(f"Demolitions Taken: {demo.get('taken', 0):.2f}")
+            lines.append(f"--- {title} ---")
+            lines.extend(
+                f"{label}: {values.get(key, 0):{spec}}{suffix}"
+                for label, key, spec, suffix in rows
+            )
+            lines.extend(
+                f"{label}: {stats[key]:{spec}}{suffix}"
+                for label, key, spec, suffix in DERIVED_DISPLAY_ROWS.get(category, ())
+            )
         
         lines.append("")
         lines.append("=" * 60)
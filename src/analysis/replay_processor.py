@@ -1,32 +1,228 @@
 """Replay processing using carball library."""
 
+import asyncio
+import gc
+import hashlib
+import importlib.util
 import logging
+import math
+import mmap
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, NamedTuple, Optional, List, Tuple
 import json
 
-# Try to import carball, but make it optional
+import numpy as np
+
+# Try to import numba, but make it optional
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 try:
-    from carball.analysis.analysis_manager import AnalysisManager
-    from carball.json_parser.game import Game
-    CARBALL_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
+    _ORJSON_OPTIONS = (
+        orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
 except ImportError:
-    CARBALL_AVAILABLE = False
-    AnalysisManager = None
-    Game = None
+    ORJSON_AVAILABLE = False
+
+# carball is optional and slow to import (protobuf descriptors, pandas), so
+# only check that it is installed here; _load_carball imports it on first parse
+CARBALL_AVAILABLE = importlib.util.find_spec('carball') is not None
+
+# Processor status; fixed once carball availability is known
+_PROCESSOR_STATUS = MappingProxyType({
+    'carball_available': CARBALL_AVAILABLE,
+    'processor_ready': True,
+    'mock_mode': not CARBALL_AVAILABLE
+})
 
 from ..config import get_settings
 from ..logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# carball's AnalysisManager class, set by the first _load_carball() call
+_analysis_manager_class: Optional[Any] = None
+
+# Version of the parsed replay cache format; bump whenever the _extract_*
+# outputs change so stale entries are ignored
+_CACHE_SCHEMA_VERSION = 5
+
+# Player proto fields read for parsed player stats; name fills 'names' and
+# is_orange becomes 'team'
+_get_player_fields = attrgetter('name', 'is_orange', 'score', 'goals', 'assists', 'saves', 'shots')
+
+# (output key, _ReplayView field, default) for game stats and replay metadata;
+# unset proto fields read as zero/empty and fall back to the default
+_GAME_STATS_FIELDS = (
+    ('duration', 'length', 300.0),
+    ('map', 'map', 'Unknown'),
+    ('match_type', 'playlist', 'Unknown'),
+    ('team_size', 'team_size', 3),
+)
+_METADATA_FIELDS = (
+    ('replay_id', 'id', 'unknown'),
+    ('date', 'time', None),
+    ('version', 'version', 'unknown'),
+)
+_get_game_stats_values = attrgetter(*(field for _, field, _ in _GAME_STATS_FIELDS))
+_get_metadata_values = attrgetter(*(field for _, field, _ in _METADATA_FIELDS))
+
+
+
+class _ReplayView(NamedTuple):
+    """Proto fields needed by the _extract_* helpers, read once per replay.
+    
+    All fields but players come from game_metadata, in _get_replay_metadata order.
+    """
+    length: float
+    map: str
+    playlist: int
+    team_size: int
+    id: str
+    time: int
+    version: int
+    players: Any
+
+
+_get_replay_metadata = attrgetter(*_ReplayView._fields[:-1])
+
+
+# Metrics calculated later, zeroed in parsed player stats
+_PLACEHOLDER_METRICS = (
+    'avg_speed',
+    'time_supersonic_speed',
+    'shooting_percentage',
+    'avg_amount',
+    'time_zero_boost',
+    'time_defensive_third',
+    'avg_distance_to_ball',
+    'time_behind_ball',
+    'amount_overfill',
+    'time_most_back',
+)
+
+# Parsed player stats columns after 'names', in output order, with their dtypes.
+# These are the narrowest that fit: per-game counts stay in the hundreds,
+# and float32 keeps speeds, distances and times well within their precision
+_PLAYER_COUNT_KEYS = ('team', 'score', 'goals', 'assists', 'saves', 'shots')
+_PLAYER_STATS_DTYPES = {
+    'team': np.int8,
+    'score': np.int32,
+    'goals': np.int16,
+    'assists': np.int16,
+    'saves': np.int16,
+    'shots': np.int16,
+    **dict.fromkeys(_PLACEHOLDER_METRICS, np.float32),
+}
+
+# Frame data thresholds, in Unreal units (uu) and carball's 0-255 boost scale
+SUPERSONIC_SPEED = 2200.0
+DEFENSIVE_THIRD_Y = 10240.0 / 6
+MAX_BOOST_AMOUNT = 255.0
+
+
+def _numpy_default(obj: Any) -> Any:
+    """json.dumps default encoding NumPy arrays and scalars like orjson's OPT_SERIALIZE_NUMPY."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes, with orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Encode data as JSON bytes, with orjson (NumPy-aware) when installed.
+    
+    Like json.dumps, orjson is made to reject datetimes and dataclasses, which
+    would not decode back to the same values.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=_ORJSON_OPTIONS)
+    return json.dumps(data, default=_numpy_default).encode('utf-8')
+
+
+# Returned in place of parsed data when carball is unavailable or parsing fails
+_MOCK_REPLAY_DATA = {
+    'game_stats': {
+        'duration': 300.0,
+        'map': 'MockMap',
+        'match_type': 'Ranked',
+        'team_size': 3
+    },
+    'player_stats': {
+        'names': ['MockPlayer'],
+        'team': [0],
+        'score': [500],
+        'goals': [2],
+        'assists': [1],
+        'saves': [3],
+        'shots': [5],
+        'avg_speed': [1200.0],
+        'time_supersonic_speed': [45.0],
+        'shooting_percentage': [0.4],
+        'avg_amount': [50.0],
+        'time_zero_boost': [20.0],
+        'time_defensive_third': [80.0],
+        'avg_distance_to_ball': [750.0],
+        'time_behind_ball': [150.0],
+        'amount_overfill': [5.0],
+        'time_most_back': [60.0]
+    },
+    'teams': [
+        {'team_id': 0, 'name': 'Blue', 'goals': 3, 'players': []},
+        {'team_id': 1, 'name': 'Orange', 'goals': 1, 'players': []}
+    ],
+    'metadata': {
+        'replay_id': 'mock_replay',
+        'date': None,
+        'version': 'mock',
+        'note': 'This is mock data. Install carball for real replay analysis.'
+    }
+}
+_MOCK_REPLAY_JSON = _json_dumps(_MOCK_REPLAY_DATA)
+
 
 class ReplayProcessor:
     """Processes Rocket League replay files using carball library."""
     
-    def __init__(self):
-        """Initialize the replay processor."""
+    __slots__ = ('settings', 'parsed_cache_dir', 'max_workers', '_executor', '_local')
+    
+    def __init__(self, max_workers: Optional[int] = None):
+        """Initialize the replay processor.
+        
+        Args:
+            max_workers: Worker processes for async parsing. If None, uses the CPU count.
+        """
         self.settings = get_settings()
+        self.parsed_cache_dir = Path(self.settings.analysis_cache_dir) / "parsed_replays"
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._local = threading.local()
         
         if not CARBALL_AVAILABLE:
             logger.warning(
@@ -50,199 +246,551 @@ class ReplayProcessor:
         if not replay_file_path.exists():
             raise FileNotFoundError(f"Replay file not found: {replay_file_path}")
         
+        return self._parse_existing_replay_file(replay_file_path)
+    
+    def parse_replay_file_json(self, replay_file_path: Path) -> bytes:
+        """Parse a replay file and return its game data encoded as JSON.
+        
+        For responses that send the bytes as they are (e.g. FastAPI's
+        ``Response(content=..., media_type="application/json")``), skipping
+        the framework's own pass over the game data.
+        
+        Raises:
+            FileNotFoundError: If replay file doesn't exist
+        """
+        game_data = self.parse_replay_file(replay_file_path)
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(
+                game_data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        return json.dumps(game_data, default=_numpy_default).encode('utf-8')
+    
+    def _parse_existing_replay_file(self, replay_file_path: Path) -> Dict[str, Any]:
+        """Parse a replay file already known to exist."""
         if not CARBALL_AVAILABLE:
             logger.warning("Carball not available, returning mock data")
             return self._get_mock_replay_data()
         
         try:
-            logger.info(f"Parsing replay file: {replay_file_path}")
+            # Identical replay files parse identically, so reuse earlier results
+            cache_path = self._get_parsed_cache_path(replay_file_path)
+            game_data = self._load_parsed_replay(cache_path)
+            if game_data is not None:
+                logger.debug("Using cached parse of replay: %s", replay_file_path.name)
+                return game_data
             
-            # Create analysis manager
-            analysis_manager = AnalysisManager()
+            logger.info("Parsing replay file: %s", replay_file_path)
             
-            # Parse the replay file
-            proto_game = analysis_manager.create_proto_from_file(str(replay_file_path))
+            analysis_manager = self._get_analysis_manager()
             
-            # Convert to JSON for easier processing
-            game = Game()
-            game.initialize(loaded_proto=proto_game)
+            # Parse the replay file; fields are read straight off the proto
+            proto_game = self._create_proto(analysis_manager, replay_file_path)
+            data_frame = self._get_data_frame(analysis_manager)
+            replay = _ReplayView(
+                *_get_replay_metadata(proto_game.game_metadata), proto_game.players
+            )
             
             # Convert to dictionary format
             game_data = {
-                'game_stats': self._extract_game_stats(game),
-                'player_stats': self._extract_player_stats(game),
-                'teams': self._extract_team_stats(game),
-                'metadata': self._extract_metadata(game)
+                'game_stats': self._extract_game_stats(replay),
+                'player_stats': self._extract_player_stats(replay, data_frame),
+                'teams': self._extract_team_stats(replay),
+                'metadata': self._extract_metadata(replay)
             }
             
-            logger.info(f"Successfully parsed replay: {replay_file_path.name}")
+            self._store_parsed_replay(cache_path, game_data)
+            
+            logger.info("Successfully parsed replay: %s", replay_file_path.name)
             return game_data
             
         except Exception as e:
-            logger.error(f"Failed to parse replay {replay_file_path}: {str(e)}")
+            logger.error("Failed to parse replay %s: %s", replay_file_path, e)
             # Return mock data as fallback
             logger.warning("Returning mock data due to parsing error")
             return self._get_mock_replay_data()
     
-    def _extract_game_stats(self, game: Any) -> Dict[str, Any]:
-        """Extract overall game statistics."""
-        if not CARBALL_AVAILABLE:
-            return {}
+    def _get_analysis_manager(self) -> Any:
+        """Return this thread's carball AnalysisManager, creating it on first use.
+        
+        The manager is reused for every replay parsed on the thread. Its frame
+        data belongs to the most recent create_proto_from_file call, so read it
+        before parsing the next replay.
+        """
+        analysis_manager = getattr(self._local, 'analysis_manager', None)
+        if analysis_manager is None:
+            analysis_manager = _load_carball()()
+            self._local.analysis_manager = analysis_manager
+        return analysis_manager
+    
+    def _create_proto(self, analysis_manager: Any, replay_file_path: Path) -> Any:
+        """Parse a replay into a proto, from a memory map when enabled and supported.
         
+        Mapping lets the kernel page the replay in on demand instead of it
+        being read into a buffer up front; carball builds without
+        create_proto_from_stream always parse from the path.
+        """
+        create_proto_from_stream = getattr(analysis_manager, 'create_proto_from_stream', None)
+        if not self.settings.replay_mmap_enabled or create_proto_from_stream is None:
+            return analysis_manager.create_proto_from_file(str(replay_file_path))
+        
+        with open(replay_file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return create_proto_from_stream(mapped)
+    
+    def _get_parsed_cache_path(self, replay_file_path: Path) -> Path:
+        """Cache file for a replay's parse result, keyed by a hash of its contents."""
+        digest = hashlib.blake2b(replay_file_path.read_bytes(), digest_size=20).hexdigest()
+        return self.parsed_cache_dir / f"{digest}.json"
+    
+    def _load_parsed_replay(self, cache_path: Path) -> Optional[Dict[str, Any]]:
+        """Load a cached parse result, or None if absent, unreadable or outdated."""
         try:
-            return {
-                'duration': getattr(game, 'game_length', 300.0),
-                'map': getattr(game, 'map_name', 'Unknown'),
-                'match_type': getattr(game, 'match_type', 'Unknown'),
-                'team_size': getattr(game, 'team_size', 3)
-            }
-        except Exception as e:
-            logger.warning(f"Error extracting game stats: {e}")
-            return {}
+            cached = _json_loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        
+        if not isinstance(cached, dict) or cached.get('schema_version') != _CACHE_SCHEMA_VERSION:
+            return None
+        game_data = cached.get('data')
+        # Refresh the modification time, which CacheManager.cleanup_expired_cache
+        # uses as the last-used time when evicting parsed replays
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        # JSON stores the player stats columns as lists
+        if isinstance(game_data, dict) and 'player_stats' in game_data:
+            game_data['player_stats'] = _player_stats_arrays(game_data['player_stats'])
+        return game_data
     
-    def _extract_player_stats(self, game: Any) -> Dict[str, Dict[str, Any]]:
-        """Extract statistics for all players."""
-        if not CARBALL_AVAILABLE:
-            return {}
+    def _store_parsed_replay(self, cache_path: Path, game_data: Dict[str, Any]) -> None:
+        """Write a parse result to the cache atomically; failures only skip caching."""
+        try:
+            # No default= so values JSON can't round-trip (e.g. datetimes) aren't cached
+            payload = _json_dumps({'schema_version': _CACHE_SCHEMA_VERSION, 'data': game_data})
+        except (TypeError, ValueError) as e:
+            logger.debug("Parse result not cacheable: %s", e)
+            return
         
         try:
-            player_stats = {}
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning("Failed to cache parsed replay: %s", e)
+    
+    async def parse_replay_file_async(self, replay_file_path: Path) -> Dict[str, Any]:
+        """Parse a replay file in a worker process without blocking the event loop.
+        
+        carball parsing is CPU-bound Python, so processes rather than threads
+        are needed for concurrent parses to use more than one core.
+        
+        Args:
+            replay_file_path: Path to the .replay file
             
-            # Get players from both teams
-            players = getattr(game, 'players', [])
+        Returns:
+            Dictionary containing parsed game data
             
-            for player in players:
-                player_name = getattr(player, 'name', 'Unknown')
-                
-                # Extract key metrics for our analysis
-                stats = {
-                    'name': player_name,
-                    'team': getattr(player, 'team', 0),
-                    'score': getattr(player, 'score', 0),
-                    'goals': getattr(player, 'goals', 0),
-                    'assists': getattr(player, 'assists', 0),
-                    'saves': getattr(player, 'saves', 0),
-                    'shots': getattr(player, 'shots', 0),
-                    # Add placeholders for metrics we'll calculate
-                    'avg_speed': 0.0,
-                    'time_supersonic_speed': 0.0,
-                    'shooting_percentage': 0.0,
-                    'avg_amount': 0.0,
-                    'time_zero_boost': 0.0,
-                    'time_defensive_third': 0.0,
-                    'avg_distance_to_ball': 0.0,
-                    'time_behind_ball': 0.0,
-                    'amount_overfill': 0.0,
-                    'time_most_back': 0.0
-                }
-                
-                player_stats[player_name] = stats
+        Raises:
+            FileNotFoundError: If replay file doesn't exist
+        """
+        if not replay_file_path.exists():
+            raise FileNotFoundError(f"Replay file not found: {replay_file_path}")
+        
+        if not CARBALL_AVAILABLE:
+            # Nothing CPU-bound to offload
+            return self.parse_replay_file(replay_file_path)
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), _parse_replay_in_worker, str(replay_file_path)
+        )
+    
+    def parse_replay_files(
+        self,
+        replay_file_paths: List[Path],
+        chunksize: int = 4
+    ) -> List[Dict[str, Any]]:
+        """Parse a batch of replay files across worker processes.
+        
+        Args:
+            replay_file_paths: Paths to the .replay files
+            chunksize: Replays handed to a worker at a time
             
-            return player_stats
+        Returns:
+            Parsed game data in the same order as replay_file_paths
             
-        except Exception as e:
-            logger.warning(f"Error extracting player stats: {e}")
-            return {}
-    
-    def _extract_team_stats(self, game: Any) -> List[Dict[str, Any]]:
-        """Extract team-level statistics."""
+        Raises:
+            FileNotFoundError: If any replay file doesn't exist
+        """
+        for replay_file_path in replay_file_paths:
+            if not replay_file_path.exists():
+                raise FileNotFoundError(f"Replay file not found: {replay_file_path}")
+        
         if not CARBALL_AVAILABLE:
-            return []
+            # Mock data needs no workers
+            return [self._parse_existing_replay_file(path) for path in replay_file_paths]
         
+        return list(self._get_executor().map(
+            _parse_replay_in_worker,
+            [str(path) for path in replay_file_paths],
+            chunksize=chunksize
+        ))
+    
+    async def parse_replay_files_async(self, replay_file_paths: List[Path]) -> List[Dict[str, Any]]:
+        """Parse several replay files concurrently across worker processes.
+        
+        Returns:
+            Parsed game data in the same order as replay_file_paths
+        """
+        return list(await asyncio.gather(
+            *(self.parse_replay_file_async(path) for path in replay_file_paths)
+        ))
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Return the worker process pool, creating it on first use."""
+        if self._executor is None:
+            # spawn avoids forking a parent that may hold threads and open sockets
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_parse_worker
+            )
+        return self._executor
+    
+    def shutdown(self) -> None:
+        """Shut down the worker process pool, if it was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    def _extract_game_stats(self, replay: _ReplayView) -> Dict[str, Any]:
+        """Extract overall game statistics."""
+        values = _get_game_stats_values(replay)
+        return {
+            key: value or default
+            for (key, _, default), value in zip(_GAME_STATS_FIELDS, values)
+        }
+    
+    def _get_data_frame(self, analysis_manager: Any) -> Optional[Any]:
+        """Get carball's per-frame data, or None if it is unavailable."""
         try:
-            teams = []
-            
-            # Extract basic team info
-            blue_team = {
-                'team_id': 0,
-                'name': 'Blue',
-                'goals': 0,
-                'players': []
-            }
-            
-            orange_team = {
-                'team_id': 1,
-                'name': 'Orange', 
-                'goals': 0,
-                'players': []
-            }
-            
-            teams.extend([blue_team, orange_team])
-            
-            return teams
-            
+            return analysis_manager.get_data_frame()
         except Exception as e:
-            logger.warning(f"Error extracting team stats: {e}")
-            return []
+            logger.warning("Frame data unavailable, frame metrics will be zero: %s", e)
+            return None
     
-    def _extract_metadata(self, game: Any) -> Dict[str, Any]:
-        """Extract replay metadata."""
-        if not CARBALL_AVAILABLE:
-            return {}
+    def _extract_player_stats(self, replay: _ReplayView, data_frame: Optional[Any] = None) -> Dict[str, Any]:
+        """Extract statistics for all players, one column per stat.
+        
+        Args:
+            replay: Fields read from the parsed carball game proto
+            data_frame: carball frame data (columns keyed by player name, 'ball'
+                and 'game'), used to calculate frame metrics when given
+        
+        Returns:
+            'names' (the players in roster order) followed by one NumPy array
+            per stat in _PLAYER_STATS_DTYPES, indexed like 'names'. Use
+            player_stats_by_name() for a per-player view.
+        """
+        # Get players from both teams
+        players = replay.players
         
         try:
-            return {
-                'replay_id': getattr(game, 'replay_id', 'unknown'),
-                'date': getattr(game, 'date', None),
-                'version': getattr(game, 'version', 'unknown')
-            }
-        except Exception as e:
-            logger.warning(f"Error extracting metadata: {e}")
-            return {}
+            rows = [_get_player_fields(player) for player in players]
+        except AttributeError as e:
+            logger.warning("Error extracting player stats: %s", e)
+            rows = []
+        
+        # Extract key metrics for our analysis, with placeholders for
+        # metrics we'll calculate
+        counts = np.array([row[1:] for row in rows], dtype=np.int64)
+        counts = counts.reshape(len(rows), len(_PLAYER_COUNT_KEYS))
+        player_stats = {'names': [row[0] for row in rows]}
+        for key, column in zip(_PLAYER_COUNT_KEYS, counts.T):
+            player_stats[key] = column.astype(_PLAYER_STATS_DTYPES[key])
+        for key in _PLACEHOLDER_METRICS:
+            player_stats[key] = np.zeros(len(rows), dtype=_PLAYER_STATS_DTYPES[key])
+        
+        if rows and data_frame is not None and 'game' in data_frame:
+            try:
+                frame_metrics = self._get_frame_metrics(data_frame, players)
+            except KeyError as e:
+                logger.warning("Frame data incomplete, frame metrics will be zero: %s", e)
+            else:
+                for index, metrics in frame_metrics:
+                    for key, value in metrics.items():
+                        player_stats[key][index] = value
+        
+        return player_stats
     
-    def _get_mock_replay_data(self) -> Dict[str, Any]:
-        """Return mock replay data when carball is not available."""
+    def _get_frame_metrics(self, data_frame: Any, players: List[Any]) -> List[Tuple[int, Dict[str, float]]]:
+        """Frame metrics for each player present in carball's frame data.
+        
+        Returns:
+            (roster index, metrics) for each player with frame data
+        
+        Raises:
+            KeyError: If the frame data lacks a column the metrics need
+        """
+        frame_deltas = data_frame['game']['delta'].to_numpy(dtype=np.float64)
+        ball_pos = _positions(data_frame['ball']) if 'ball' in data_frame else None
+        rearmost_y = self._get_rearmost_y(data_frame, players)
+        
+        return [
+            (index, _frame_metrics(
+                data_frame[player.name], frame_deltas, int(player.is_orange),
+                ball_pos, rearmost_y[player.is_orange]
+            ))
+            for index, player in enumerate(players)
+            if player.name in data_frame
+        ]
+    
+    def _get_rearmost_y(self, data_frame: Any, players: List[Any]) -> tuple:
+        """Per-frame y of each team's rearmost player, as (blue, orange)."""
+        team_columns = ([], [])
+        for player in players:
+            if player.name in data_frame:
+                team_columns[player.is_orange].append(
+                    data_frame[player.name]['pos_y'].to_numpy(dtype=np.float32)
+                )
+        
+        frame_count = len(data_frame)
+        blue, orange = (
+            np.column_stack(columns) if columns else np.full((frame_count, 1), np.nan, dtype=np.float32)
+            for columns in team_columns
+        )
+        # Blue defends negative y and orange positive y; fmin/fmax skip
+        # players missing from a frame
+        return np.fmin.reduce(blue, axis=1), np.fmax.reduce(orange, axis=1)
+    
+    def _extract_team_stats(self, replay: _ReplayView) -> List[Dict[str, Any]]:
+        """Extract team-level statistics."""
+        teams = []
+        
+        # Extract basic team info
+        blue_team = {
+            'team_id': 0,
+            'name': 'Blue',
+            'goals': 0,
+            'players': []
+        }
+        
+        orange_team = {
+            'team_id': 1,
+            'name': 'Orange', 
+            'goals': 0,
+            'players': []
+        }
+        
+        teams.extend([blue_team, orange_team])
+        
+        return teams
+    
+    def _extract_metadata(self, replay: _ReplayView) -> Dict[str, Any]:
+        """Extract replay metadata."""
+        values = _get_metadata_values(replay)
         return {
-            'game_stats': {
-                'duration': 300.0,
-                'map': 'MockMap',
-                'match_type': 'Ranked',
-                'team_size': 3
-            },
-            'player_stats': {
-                'MockPlayer': {
-                    'name': 'MockPlayer',
-                    'team': 0,
-                    'score': 500,
-                    'goals': 2,
-                    'assists': 1,
-                    'saves': 3,
-                    'shots': 5,
-                    'avg_speed': 1200.0,
-                    'time_supersonic_speed': 45.0,
-                    'shooting_percentage': 0.4,
-                    'avg_amount': 50.0,
-                    'time_zero_boost': 20.0,
-                    'time_defensive_third': 80.0,
-                    'avg_distance_to_ball': 750.0,
-                    'time_behind_ball': 150.0,
-                    'amount_overfill': 5.0,
-                    'time_most_back': 60.0
-                }
-            },
-            'teams': [
-                {'team_id': 0, 'name': 'Blue', 'goals': 3, 'players': []},
-                {'team_id': 1, 'name': 'Orange', 'goals': 1, 'players': []}
-            ],
-            'metadata': {
-                'replay_id': 'mock_replay',
-                'date': None,
-                'version': 'mock',
-                'note': 'This is mock data. Install carball for real replay analysis.'
-            }
+            key: value or default
+            for (key, _, default), value in zip(_METADATA_FIELDS, values)
         }
     
+    def _get_mock_replay_data(self) -> Dict[str, Any]:
+        """Return mock replay data when carball is not available."""
+        # Decoded fresh each call, so callers may modify the result
+        game_data = _json_loads(_MOCK_REPLAY_JSON)
+        game_data['player_stats'] = _player_stats_arrays(game_data['player_stats'])
+        return game_data
+    
     def is_available(self) -> bool:
         """Check if carball is available for replay processing."""
         return CARBALL_AVAILABLE
     
-    def get_status(self) -> Dict[str, Any]:
-        """Get the current status of the replay processor."""
-        return {
-            'carball_available': CARBALL_AVAILABLE,
-            'processor_ready': True,
-            'mock_mode': not CARBALL_AVAILABLE
-        }
+    def get_status(self) -> Mapping[str, bool]:
+        """Get the current status of the replay processor (read-only)."""
+        return _PROCESSOR_STATUS
+
+
+def _load_carball() -> Any:
+    """Import carball on first use and return its AnalysisManager class."""
+    global _analysis_manager_class
+    if _analysis_manager_class is None:
+        from carball.analysis.analysis_manager import AnalysisManager
+        _analysis_manager_class = AnalysisManager
+    return _analysis_manager_class
+
+
+# Processor reused by all parses within one worker process
+_worker_processor: Optional[ReplayProcessor] = None
+
+
+def player_stats_by_name(player_stats: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Per-player view of parsed player stats columns, keyed by player name.
+    
+    Each player's dict has 'name' followed by the stats, as plain Python
+    values; if two players share a name, the later one wins.
+    """
+    columns = [
+        (key, np.asarray(player_stats[key]).tolist()) for key in _PLAYER_STATS_DTYPES
+    ]
+    return {
+        name: {'name': name, **{key: values[index] for key, values in columns}}
+        for index, name in enumerate(player_stats['names'])
+    }
+
+
+def _player_stats_arrays(player_stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert player stats columns decoded from JSON lists back to arrays."""
+    return {
+        key: np.asarray(values, dtype=_PLAYER_STATS_DTYPES[key])
+        if key in _PLAYER_STATS_DTYPES else values
+        for key, values in player_stats.items()
+    }
+
+
+def _frame_metrics(
+    player_frames: Any,
+    deltas: np.ndarray,
+    team: int,
+    ball_pos: Optional[np.ndarray],
+    rearmost_y: np.ndarray
+) -> Dict[str, float]:
+    """Calculate a player's frame metrics with column-wise reductions.
+    
+    Args:
+        player_frames: The player's frame columns (pos_*, vel_*, boost)
+        deltas: Seconds elapsed in each frame
+        team: 0 for blue (defending negative y), 1 for orange
+        ball_pos: Ball positions per frame, or None if the ball was not tracked
+        rearmost_y: Per-frame y of the player's rearmost teammate (or themselves)
+    """
+    velocity = player_frames[['vel_x', 'vel_y', 'vel_z']].to_numpy(dtype=np.float64)
+    speed = np.sqrt(np.einsum('ij,ij->i', velocity, velocity))
+    boost = player_frames['boost'].to_numpy(dtype=np.float64)
+    pos_y = player_frames['pos_y'].to_numpy(dtype=np.float64)
+    
+    # Frames where the player is not on the field are NaN; comparisons
+    # against NaN are False, so they never count towards a time total
+    if team == 0:
+        in_defensive_third = pos_y < -DEFENSIVE_THIRD_Y
+    else:
+        in_defensive_third = pos_y > DEFENSIVE_THIRD_Y
+    
+    metrics = {
+        'avg_speed': _nan_mean(speed),
+        'time_supersonic_speed': float(deltas[speed >= SUPERSONIC_SPEED].sum()),
+        'avg_amount': _nan_mean(boost) * 100.0 / MAX_BOOST_AMOUNT,
+        'time_zero_boost': float(deltas[boost == 0].sum()),
+        'time_defensive_third': float(deltas[in_defensive_third].sum()),
+    }
+    
+    if ball_pos is None:
+        ball_pos = np.full((deltas.shape[0], 3), np.nan, dtype=np.float32)
+    avg_distance, time_behind, time_most_back = _positional_kernel(
+        _positions(player_frames), ball_pos, rearmost_y,
+        1.0 if team else -1.0, deltas
+    )
+    metrics['avg_distance_to_ball'] = float(avg_distance)
+    metrics['time_behind_ball'] = float(time_behind)
+    metrics['time_most_back'] = float(time_most_back)
+    return metrics
+
+
+def _positions(frames: Any) -> np.ndarray:
+    """Frame positions as a contiguous (frames, 3) float32 array."""
+    return np.ascontiguousarray(frames[['pos_x', 'pos_y', 'pos_z']].to_numpy(dtype=np.float32))
+
+
+@njit(cache=True, nogil=True)
+def _positional_kernel(
+    player_pos: np.ndarray,
+    ball_pos: np.ndarray,
+    rearmost_y: np.ndarray,
+    own_goal_side: float,
+    deltas: np.ndarray
+) -> Tuple[float, float, float]:
+    """Single pass over the frames for the ball- and teammate-relative metrics.
+    
+    own_goal_side is the sign of y at the player's own goal. Frames where the
+    player (or, for the ball metrics, the ball) is missing are skipped.
+    
+    Returns:
+        Tuple of (avg_distance_to_ball, time_behind_ball, time_most_back)
+    """
+    distance_total = 0.0
+    distance_frames = 0
+    time_behind = 0.0
+    time_most_back = 0.0
+    for i in range(deltas.shape[0]):
+        player_y = player_pos[i, 1]
+        if not np.isfinite(player_y):
+            continue
+        if player_y * own_goal_side >= rearmost_y[i] * own_goal_side:
+            time_most_back += deltas[i]
+        
+        dx = player_pos[i, 0] - ball_pos[i, 0]
+        dy = player_y - ball_pos[i, 1]
+        dz = player_pos[i, 2] - ball_pos[i, 2]
+        distance = math.sqrt(dx * dx + dy * dy + dz * dz)
+        if not np.isfinite(distance):
+            continue
+        distance_total += distance
+        distance_frames += 1
+        if player_y * own_goal_side > ball_pos[i, 1] * own_goal_side:
+            time_behind += deltas[i]
+    
+    avg_distance = distance_total / distance_frames if distance_frames else 0.0
+    return avg_distance, time_behind, time_most_back
+
+
+def _warm_kernels() -> None:
+    """Compile (or load from numba's on-disk cache) the frame kernels up front."""
+    empty = np.empty((0, 3), dtype=np.float32)
+    _positional_kernel(empty, empty, np.empty(0, dtype=np.float32), 1.0,
+                       np.empty(0, dtype=np.float64))
+
+
+def _nan_mean(values: np.ndarray) -> float:
+    """Mean of the non-NaN values, or 0.0 if there are none."""
+    present = values[~np.isnan(values)]
+    return float(present.mean()) if present.size else 0.0
+
+
+def _init_parse_worker() -> None:
+    """Set up a pool worker before its first parse.
+    
+    carball is imported and frame kernels are compiled (or loaded from
+    numba's cache) here rather than during the first parse. Everything imported or built here lives for
+    the whole worker, so it is moved out of the collector's reach with
+    gc.freeze(); later collections then only scan objects created while
+    parsing replays.
+    """
+    global _worker_processor
+    _worker_processor = ReplayProcessor()
+    if CARBALL_AVAILABLE:
+        try:
+            _load_carball()
+        except ImportError:
+            # Left for the parse itself to report and fall back to mock data
+            pass
+    if NUMBA_AVAILABLE:
+        _warm_kernels()
+    gc.freeze()
+
+
+def _parse_replay_in_worker(replay_file_path: str) -> Dict[str, Any]:
+    """Parse a replay inside a pool worker; module level so it can be pickled."""
+    global _worker_processor
+    if _worker_processor is None:
+        _worker_processor = ReplayProcessor()
+    # The caller has already checked that the file exists
+    return _worker_processor._parse_existing_replay_file(Path(replay_file_path))
 
 
 # Convenience function for creating processor
@@ -1,11 +1,25 @@
 """Statistical analysis engine for win/loss correlation analysis."""
 
+import math
 import numpy as np
-from typing import Dict, Any, List, Tuple, Optional, NamedTuple
+from typing import Dict, Any, List, Sequence, Tuple, Optional, NamedTuple
 from scipy import stats
 from scipy.stats import ttest_ind
 import warnings
 
+# Try to import numba, but make it optional
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 from ..config import get_settings
 from ..logging_config import get_logger, log_performance, LoggingMixin
 from .exceptions import (
@@ -35,6 +49,118 @@ class CorrelationResult(NamedTuple):
     insight_message: str
 
 
+def _to_float_array(values: List[Any]) -> np.ndarray:
+    """Convert values to a float64 array, with NaN for values float() rejects."""
+    try:
+        array = np.asarray(values, dtype=np.float64)
+        if array.ndim == 1:
+            return array
+    except (ValueError, TypeError, OverflowError):
+        pass
+    
+    # Mixed in non-numeric values (or sequences); convert one at a time
+    converted = np.empty(len(values), dtype=np.float64)
+    for i, value in enumerate(values):
+        try:
+            converted[i] = float(value)
+        except (ValueError, TypeError):
+            converted[i] = np.nan
+    return converted
+
+
+def _padded_columns(columns: List[np.ndarray]) -> np.ndarray:
+    """Stack 1-D arrays as the columns of a float64 matrix, padding with NaN."""
+    matrix = np.full((max(len(column) for column in columns), len(columns)), np.nan)
+    for j, column in enumerate(columns):
+        matrix[:len(column), j] = column
+    return matrix
+
+
+@njit(cache=True, nogil=True)
+def _moments_within(
+    matrix: np.ndarray,
+    centers: np.ndarray,
+    limits: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Count, mean and sample variance of each column's values near its center.
+    
+    Values that are NaN, or at least limits[j] away from centers[j], are
+    skipped. A single row-major pass uses Welford's online update, which
+    stays accurate without a separate pass for the mean. The reported mean
+    is the plain total over the count, which is exact for whole-number data,
+    where the running mean can be an ulp off. Columns without values get a
+    NaN mean, and those with fewer than two a NaN variance.
+    
+    Returns:
+        Tuple of (counts, means, variances), one entry per column
+    """
+    rows, columns = matrix.shape
+    counts = np.zeros(columns, dtype=np.int64)
+    totals = np.zeros(columns)
+    means = np.zeros(columns)
+    squares = np.zeros(columns)
+    for i in range(rows):
+        for j in range(columns):
+            value = matrix[i, j]
+            if np.isnan(value) or abs(value - centers[j]) >= limits[j]:
+                continue
+            counts[j] += 1
+            totals[j] += value
+            delta = value - means[j]
+            means[j] += delta / counts[j]
+            squares[j] += delta * (value - means[j])
+    
+    variances = np.empty(columns)
+    for j in range(columns):
+        means[j] = totals[j] / counts[j] if counts[j] > 0 else np.nan
+        variances[j] = squares[j] / (counts[j] - 1) if counts[j] > 1 else np.nan
+    return counts, means, variances
+
+
+@njit(cache=True, nogil=True)
+def _column_moments(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Count, mean and sample variance of each column's non-NaN values."""
+    columns = matrix.shape[1]
+    return _moments_within(matrix, np.zeros(columns), np.full(columns, np.inf))
+
+
+@njit(cache=True, nogil=True)
+def _clipped_column_moments(
+    matrix: np.ndarray,
+    z_threshold: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Count, mean and sample variance of each column once outliers are removed.
+    
+    Column-wise StatisticalAnalyzer._remove_outliers fused with the moments:
+    the first pass finds each column's mean and standard deviation, the
+    second accumulates only values within z_threshold deviations. Columns too
+    short to have outliers, or without spread, keep every value.
+    """
+    counts, means, variances = _column_moments(matrix)
+    
+    limits = np.full(matrix.shape[1], np.inf)
+    for j in range(limits.shape[0]):
+        n = counts[j]
+        # See _can_have_outliers
+        if n > 1 and (n - 1) / math.sqrt(n) >= z_threshold:
+            limit = z_threshold * math.sqrt(variances[j] * (n - 1) / n)
+            if limit > 0:
+                limits[j] = limit
+    
+    return _moments_within(matrix, means, limits)
+
+
+def _can_have_outliers(count: Any, z_threshold: float) -> Any:
+    """Whether count values can include one z_threshold deviations from their mean.
+    
+    With population standard deviation no value of n can lie more than
+    (n - 1) / sqrt(n) deviations out, so for a 3-sigma threshold samples of
+    10 or fewer never have outliers.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (count - 1) / np.sqrt(count) >= z_threshold
+
+
 class StatisticalAnalyzer(LoggingMixin):
     """Performs statistical analysis on game metrics for coaching insights."""
     
@@ -72,9 +198,11 @@ class StatisticalAnalyzer(LoggingMixin):
             wins_metrics = self._extract_metrics_from_games(wins_data)
             losses_metrics = self._extract_metrics_from_games(losses_data)
             
-            # Analyze each metric
-            results = {}
-            available_metrics = set(wins_metrics.keys()) & set(losses_metrics.keys())
+            # Analyze all metrics present in both groups at once
+            available_metrics = [
+                name for name in wins_metrics
+                if name in losses_metrics and is_valid_metric(name)
+            ]
             
             self.logger.info(
                 "Starting correlation analysis",
@@ -83,27 +211,9 @@ class StatisticalAnalyzer(LoggingMixin):
                 metrics_count=len(available_metrics)
             )
             
-            for metric_name in available_metrics:
-                try:
-                    if not is_valid_metric(metric_name):
-                        continue
-                    
-                    wins_values = wins_metrics[metric_name]
-                    losses_values = losses_metrics[metric_name]
-                    
-                    result = self._analyze_single_metric(
-                        metric_name, wins_values, losses_values, min_size
-                    )
-                    
-                    if result:
-                        results[metric_name] = result
-                
-                except Exception as e:
-                    self.logger.warning(
-                        "Failed to analyze metric",
-                        metric=metric_name,
-                        error=str(e)
-                    )
+            results = self._analyze_metrics(
+                available_metrics, wins_metrics, losses_metrics, min_size
+            )
             
             self.logger.info(
                 "Correlation analysis completed",
@@ -150,112 +260,37 @@ class StatisticalAnalyzer(LoggingMixin):
                 actual_count=losses_count
             )
     
-    def _extract_metrics_from_games(self, games_data: List[Dict[str, Any]]) -> Dict[str, List[float]]:
-        """Extract metrics from list of games."""
-        metrics = {}
+    def _extract_metrics_from_games(self, games_data: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """Extract each metric's finite values from a list of games, in game order."""
+        raw_values: Dict[str, List[Any]] = {}
         
         for game in games_data:
-            game_metrics = game.get('metrics', {})
-            
-            for metric_name, value in game_metrics.items():
-                if metric_name not in metrics:
-                    metrics[metric_name] = []
-                
-                # Convert to float and handle invalid values
-                try:
-                    float_value = float(value)
-                    if not (np.isnan(float_value) or np.isinf(float_value)):
-                        metrics[metric_name].append(float_value)
-                except (ValueError, TypeError):
-                    continue
+            for metric_name, value in game.get('metrics', {}).items():
+                raw_values.setdefault(metric_name, []).append(value)
+        
+        # Convert each metric at once, then drop invalid (NaN) and infinite values
+        metrics = {}
+        for metric_name, values in raw_values.items():
+            array = _to_float_array(values)
+            metrics[metric_name] = array[np.isfinite(array)]
         
         return metrics
     
     def _analyze_single_metric(
         self,
         metric_name: str,
-        wins_values: List[float],
-        losses_values: List[float],
+        wins_values: Sequence[float],
+        losses_values: Sequence[float],
         min_sample_size: int
     ) -> Optional[CorrelationResult]:
         """Analyze a single metric for win/loss correlation."""
         try:
-            # Check sample sizes
-            if len(wins_values) < min_sample_size or len(losses_values) < min_sample_size:
-                return None
-            
-            # Convert to numpy arrays
-            wins_array = np.array(wins_values)
-            losses_array = np.array(losses_values)
-            
-            # Remove outliers (beyond 3 standard deviations)
-            wins_clean = self._remove_outliers(wins_array)
-            losses_clean = self._remove_outliers(losses_array)
-            
-            # Recalculate means and standard deviations
-            wins_mean = np.mean(wins_clean)
-            losses_mean = np.mean(losses_clean)
-            wins_std = np.std(wins_clean, ddof=1) if len(wins_clean) > 1 else 0
-            losses_std = np.std(losses_clean, ddof=1) if len(losses_clean) > 1 else 0
-            
-            # Perform t-test (Welch's t-test for unequal variances)
-            try:
-                t_stat, p_value = ttest_ind(wins_clean, losses_clean, equal_var=False)
-            except Exception:
-                # Fallback for edge cases
-                p_value = 1.0
-                t_stat = 0.0
-            
-            # Calculate effect size (Cohen's d)
-            effect_size = self._calculate_cohens_d(wins_clean, losses_clean)
-            
-            # Determine confidence level
-            confidence_level = self._determine_confidence_level(p_value)
-            
-            # Check statistical significance
-            statistically_significant = p_value < self.significance_threshold
-            
-            # Check practical significance
-            practical_significance = abs(effect_size) >= self.effect_size_threshold
-            
-            # Check sample size adequacy
-            sample_size_adequate = (
-                len(wins_clean) >= min_sample_size and 
-                len(losses_clean) >= min_sample_size
-            )
-            
-            # Generate insight message
-            insight_message = self._generate_insight_message(
-                metric_name, wins_mean, losses_mean, effect_size, confidence_level
+            results = self._analyze_metrics(
+                [metric_name],
+                {metric_name: np.asarray(wins_values, dtype=np.float64)},
+                {metric_name: np.asarray(losses_values, dtype=np.float64)},
+                min_sample_size
             )
-            
-            result = CorrelationResult(
-                metric_name=metric_name,
-                wins_mean=wins_mean,
-                losses_mean=losses_mean,
-                wins_std=wins_std,
-                losses_std=losses_std,
-                effect_size=effect_size,
-                p_value=p_value,
-                confidence_level=confidence_level,
-                statistically_significant=statistically_significant,
-                practical_significance=practical_significance,
-                sample_size_adequate=sample_size_adequate,
-                insight_message=insight_message
-            )
-            
-            self.logger.debug(
-                "Metric analysis completed",
-                metric=metric_name,
-                wins_mean=wins_mean,
-                losses_mean=losses_mean,
-                effect_size=effect_size,
-                p_value=p_value,
-                significant=statistically_significant
-            )
-            
-            return result
-        
         except Exception as e:
             self.logger.error(
                 "Error analyzing metric",
@@ -263,14 +298,149 @@ class StatisticalAnalyzer(LoggingMixin):
                 error=str(e)
             )
             return None
+        return results.get(metric_name)
+    
+    def _analyze_metrics(
+        self,
+        metric_names: List[str],
+        wins_metrics: Dict[str, np.ndarray],
+        losses_metrics: Dict[str, np.ndarray],
+        min_sample_size: int
+    ) -> Dict[str, CorrelationResult]:
+        """Analyze several metrics for win/loss correlation at once.
+        
+        Each group's values become a NaN-padded (games x metrics) matrix, so
+        outlier removal and the group moments take two compiled passes, and
+        Welch's t-test and Cohen's d are whole-array operations over every
+        metric.
+        Metrics with fewer than min_sample_size wins or losses are skipped.
+        """
+        metric_names = [
+            name for name in metric_names
+            if len(wins_metrics[name]) >= min_sample_size
+            and len(losses_metrics[name]) >= min_sample_size
+        ]
+        if not metric_names:
+            return {}
+        
+        # Counts, means and sample variances with outliers (beyond 3 standard
+        # deviations) removed
+        n1, wins_means, wins_vars = _clipped_column_moments(
+            _padded_columns([wins_metrics[name] for name in metric_names]), 3.0
+        )
+        n2, losses_means, losses_vars = _clipped_column_moments(
+            _padded_columns([losses_metrics[name] for name in metric_names]), 3.0
+        )
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Welch's t-test with Welch-Satterthwaite degrees of freedom; like
+            # scipy's ttest_ind, fall back to one degree of freedom when both
+            # variances are zero
+            vn1 = wins_vars / n1
+            vn2 = losses_vars / n2
+            t_stats = (wins_means - losses_means) / np.sqrt(vn1 + vn2)
+            dofs = (vn1 + vn2) ** 2 / (vn1 ** 2 / (n1 - 1) + vn2 ** 2 / (n2 - 1))
+            dofs[np.isnan(dofs)] = 1.0
+            
+            # Two-sided p-values for all metrics in one call
+            p_values = 2 * stats.t.sf(np.abs(t_stats), dofs)
+            
+            wins_stds = np.where(n1 > 1, np.sqrt(wins_vars), 0.0)
+            losses_stds = np.where(n2 > 1, np.sqrt(losses_vars), 0.0)
+            
+            # Cohen's d from the same moments; 0 without two values per group
+            # or any spread
+            pooled_stds = np.sqrt(
+                ((n1 - 1) * wins_vars + (n2 - 1) * losses_vars) / (n1 + n2 - 2)
+            )
+            effect_sizes = (wins_means - losses_means) / pooled_stds
+            effect_sizes[(n1 < 2) | (n2 < 2) | (pooled_stds == 0)] = 0.0
+        
+        results = {}
+        for i, metric_name in enumerate(metric_names):
+            try:
+                results[metric_name] = self._build_correlation_result(
+                    metric_name,
+                    float(wins_means[i]),
+                    float(losses_means[i]),
+                    float(wins_stds[i]),
+                    float(losses_stds[i]),
+                    float(effect_sizes[i]),
+                    float(p_values[i]),
+                    n1[i] >= min_sample_size and n2[i] >= min_sample_size
+                )
+            except Exception as e:
+                self.logger.error(
+                    "Error analyzing metric",
+                    metric=metric_name,
+                    error=str(e)
+                )
+        
+        return results
+    
+    def _build_correlation_result(
+        self,
+        metric_name: str,
+        wins_mean: float,
+        losses_mean: float,
+        wins_std: float,
+        losses_std: float,
+        effect_size: float,
+        p_value: float,
+        sample_size_adequate: bool
+    ) -> CorrelationResult:
+        """Classify one metric's statistics and describe them in a CorrelationResult."""
+        # Determine confidence level
+        confidence_level = self._determine_confidence_level(p_value)
+        
+        # Check statistical significance
+        statistically_significant = p_value < self.significance_threshold
+        
+        # Check practical significance
+        practical_significance = abs(effect_size) >= self.effect_size_threshold
+        
+        # Generate insight message
+        insight_message = self._generate_insight_message(
+            metric_name, wins_mean, losses_mean, effect_size, confidence_level
+        )
+        
+        result = CorrelationResult(
+            metric_name=metric_name,
+            wins_mean=wins_mean,
+            losses_mean=losses_mean,
+            wins_std=wins_std,
+            losses_std=losses_std,
+            effect_size=effect_size,
+            p_value=p_value,
+            confidence_level=confidence_level,
+            statistically_significant=statistically_significant,
+            practical_significance=practical_significance,
+            sample_size_adequate=bool(sample_size_adequate),
+            insight_message=insight_message
+        )
+        
+        self.logger.debug(
+            "Metric analysis completed",
+            metric=metric_name,
+            wins_mean=wins_mean,
+            losses_mean=losses_mean,
+            effect_size=effect_size,
+            p_value=p_value,
+            significant=statistically_significant
+        )
+        
+        return result
     
     def _remove_outliers(self, data: np.ndarray, z_threshold: float = 3.0) -> np.ndarray:
         """Remove outliers beyond z_threshold standard deviations."""
-        if len(data) < 3:  # Need at least 3 points for meaningful outlier detection
+        if not _can_have_outliers(len(data), z_threshold):
             return data
         
-        z_scores = np.abs(stats.zscore(data))
-        return data[z_scores < z_threshold]
+        mean = data.mean()
+        std = data.std()
+        if std == 0:
+            return data
+        return data[np.fabs(data - mean) < z_threshold * std]
     
     def _calculate_cohens_d(self, group1: np.ndarray, group2: np.ndarray) -> float:
         """Calculate Cohen's d effect size."""
@@ -7,8 +7,41 @@ This version includes corrections for win/loss detection and boost efficiency.
 import os
 import sys
 import requests
-from typing import Dict, List, Any
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Any, Optional
 from collections import defaultdict
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Shared session so keep-alive connections are reused across replay fetches
+_session: Optional[requests.Session] = None
+
+def get_session() -> requests.Session:
+    """Return the shared HTTP session, creating it on first use."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        # Retry rate limits and transient server errors; Retry honours Retry-After.
+        # raise_on_status=False hands the last response back for the status checks below.
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False
+        )
+        _session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=16, max_retries=retries))
+    return _session
+
+def decode_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, with orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
 
 def get_player_stats(username: str, num_replays: int = 20) -> Dict[str, Any]:
     """Fetch and analyze player statistics from recent replays."""
@@ -26,13 +59,15 @@ def get_player_stats(username: str, num_replays: int = 20) -> Dict[str, Any]:
         'count': num_replays
     }
     
+    session = get_session()
+    
     print(f"Fetching replays for {username}...")
-    response = requests.get(search_url, headers=headers, params=params)
+    response = session.get(search_url, headers=headers, params=params)
     
     if response.status_code != 200:
         raise Exception(f"API error: {response.status_code}")
     
-    data = response.json()
+    data = decode_json(response)
     replay_list = data.get('list', [])
     
     if not replay_list:
@@ -52,13 +87,13 @@ def get_player_stats(username: str, num_replays: int = 20) -> Dict[str, Any]:
         
         # Get full replay details
         replay_url = f'https://ballchasing.com/api/replays/{replay_id}'
-        replay_response = requests.get(replay_url, headers=headers)
+        replay_response = session.get(replay_url, headers=headers)
         
         if replay_response.status_code != 200:
             print(f"  Skipping replay {replay_id} (error fetching details)")
             continue
         
-        replay = replay_response.json()
+        replay = decode_json(replay_response)
         
         # Find which team the player is on and their stats
         player_team = None
@@ -5,7 +5,7 @@ import aiohttp
 import aiofiles
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from urllib.parse import urlencode
 import time
 
@@ -58,6 +58,9 @@ class BallchasingClient:
         # Session for async requests
         self._session: Optional[aiohttp.ClientSession] = None
         
+        # Lowercased player name -> team color for the last replay looked up
+        self._player_team_index: Tuple[Optional[Dict[str, Any]], Dict[str, str]] = (None, {})
+        
         logger.info("Ballchasing client initialized")
     
     async def __aenter__(self):
@@ -273,25 +276,11 @@ class BallchasingClient:
             ValueError: If player not found in replay
         """
         try:
-            # Look for the player in both teams
             blue_team = replay_metadata.get('blue', {})
             orange_team = replay_metadata.get('orange', {})
             
-            player_team = None
-            
-            # Check blue team
-            if 'players' in blue_team:
-                for player in blue_team['players']:
-                    if player.get('name', '').lower() == player_name.lower():
-                        player_team = 'blue'
-                        break
-            
-            # Check orange team if not found in blue
-            if player_team is None and 'players' in orange_team:
-                for player in orange_team['players']:
-                    if player.get('name', '').lower() == player_name.lower():
-                        player_team = 'orange'
-                        break
+            # Look for the player in both teams
+            player_team = self._get_player_teams(replay_metadata).get(player_name.lower())
             
             if player_team is None:
                 raise ValueError(f"Player {player_name} not found in replay")
@@ -332,6 +321,20 @@ class BallchasingClient:
             # Default to loss if we can't determine the result
             return 'loss'
     
+    def _get_player_teams(self, replay_metadata: Dict[str, Any]) -> Dict[str, str]:
+        """Map lowercased player names to team color, cached for the last replay.
+        
+        Blue is indexed first, so it wins if a name appears on both teams.
+        """
+        cached_metadata, player_teams = self._player_team_index
+        if cached_metadata is not replay_metadata:
+            player_teams = {}
+            for team_color in ('blue', 'orange'):
+                for player in replay_metadata.get(team_color, {}).get('players', []):
+                    player_teams.setdefault(player.get('name', '').lower(), team_color)
+            self._player_team_index = (replay_metadata, player_teams)
+        return player_teams
+    
     async def get_replay_details(self, replay_id: str) -> Dict[str, Any]:
         """Get detailed replay information.
         
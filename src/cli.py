@@ -206,6 +206,7 @@ def cache_cleanup():
         console.print(f"[green]✅ Cleanup completed![/green]")
         console.print(f"Removed {stats['replays_removed']} expired replays")
         console.print(f"Removed {stats['analysis_removed']} expired analysis results")
+        console.print(f"Removed {stats['parsed_replays_removed']} unused parsed replays")
         console.print(f"Removed {stats['files_removed']} files total")
     except Exception as e:
         console.print(f"[red]Cleanup failed: {str(e)}[/red]")
@@ -334,6 +335,12 @@ async def _run_analysis_with_progress(request):
     except Exception as e:
         console.print(f"[red]Analysis failed: {str(e)}[/red]")
         return None
+    finally:
+        try:
+            from services.analysis_service import close_analysis_service
+            close_analysis_service()
+        except ImportError:
+            pass
 
 
 def _display_analysis_result(result):
@@ -30,6 +30,11 @@ class Settings(BaseSettings):
     analysis_cache_dir: str = "data/cache" 
     player_data_dir: str = "data/players"
     
+    # Replays downloaded and parsed at once during an analysis
+    max_concurrent_analysis: int = 4
+    # Memory-map replay files for carball builds that can parse from a stream
+    replay_mmap_enabled: bool = False
+    
     # Logging settings
     log_format: str = "standard"  # "json" or "standard"
     log_file: str = "app.log"
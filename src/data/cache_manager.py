@@ -1,6 +1,7 @@
 """Cache management system for replay files and analysis results."""
 
 import json
+import os
 import sqlite3
 import time
 from datetime import datetime, timedelta
@@ -9,6 +10,7 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 import hashlib
 import shutil
 import tempfile
+import threading
 
 from ..config import get_settings
 from ..logging_config import get_logger
@@ -33,10 +35,18 @@ class CacheManager:
         self.analysis_cache = self.base_cache_dir / "analysis" 
         self.player_cache = self.base_cache_dir / "players"
         self.metadata_cache = self.base_cache_dir / "metadata"
+        # Content-hash parse results written by ReplayProcessor; tracked by file
+        # age rather than in the database
+        self.parsed_replays_cache = self.base_cache_dir / "parsed_replays"
         
         # Database path
         self.db_path = self.base_cache_dir / "cache.db"
         
+        # One SQLite connection per thread, reused across calls; the generation
+        # changes when the database file is replaced so stale connections reopen
+        self._local = threading.local()
+        self._db_generation = 0
+        
         # Initialize cache structure
         self._init_cache_structure()
         self._init_database()
@@ -49,6 +59,7 @@ class CacheManager:
             self.analysis_cache,
             self.player_cache,
             self.metadata_cache,
+            self.parsed_replays_cache,
         ]
         
         for directory in directories:
@@ -56,9 +67,25 @@ class CacheManager:
             
         logger.info("Cache directory structure initialized", base_dir=str(self.base_cache_dir))
     
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return this thread's database connection, opening it on first use.
+        
+        Use it as ``with self._get_connection() as conn:``, which commits or
+        rolls back the transaction but leaves the connection open for reuse.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.generation != self._db_generation:
+            if conn is not None:
+                conn.close()
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+            self._local.generation = self._db_generation
+        return conn
+    
     def _init_database(self) -> None:
         """Initialize SQLite database for cache metadata."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS replay_cache (
                     replay_id TEXT PRIMARY KEY,
@@ -154,7 +181,7 @@ class CacheManager:
         now = datetime.now()
         
         # Update database
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO replay_cache 
                 (replay_id, gamertag, file_path, file_size, cached_at, last_accessed, game_date, game_result, ttl_hours)
@@ -185,8 +212,7 @@ class CacheManager:
         Returns:
             Path to cached file or None if not found/expired
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._get_connection() as conn:
             cursor = conn.execute("""
                 SELECT file_path, cached_at, ttl_hours 
                 FROM replay_cache 
@@ -212,7 +238,7 @@ class CacheManager:
             return None
         
         # Update last accessed time
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             conn.execute("""
                 UPDATE replay_cache 
                 SET last_accessed = ? 
@@ -254,7 +280,7 @@ class CacheManager:
         metadata_json = json.dumps(metadata) if metadata else None
         
         # Update database
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO analysis_cache
                 (cache_key, gamertag, analysis_type, result_path, cached_at, last_accessed, ttl_hours, metadata)
@@ -291,8 +317,7 @@ class CacheManager:
         Returns:
             Tuple of (cache_key, result_data) or None if not found/expired
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._get_connection() as conn:
             cursor = conn.execute("""
                 SELECT cache_key, result_path, cached_at, ttl_hours
                 FROM analysis_cache 
@@ -333,7 +358,7 @@ class CacheManager:
             return None
         
         # Update last accessed time
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             conn.execute("""
                 UPDATE analysis_cache 
                 SET last_accessed = ? 
@@ -360,7 +385,7 @@ class CacheManager:
             game_result: 'win' or 'loss'
             rank_tier: Player's rank tier
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO player_history
                 (gamertag, replay_id, game_date, game_result, rank_tier, cached_at)
@@ -412,25 +437,31 @@ class CacheManager:
             query += " LIMIT ?"
             params.append(limit)
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._get_connection() as conn:
             cursor = conn.execute(query, params)
             rows = cursor.fetchall()
         
         return [dict(row) for row in rows]
     
-    def cleanup_expired_cache(self) -> Dict[str, int]:
+    def cleanup_expired_cache(self, parsed_replay_ttl_hours: int = 168) -> Dict[str, int]:
         """Remove expired cache entries and files.
         
+        Args:
+            parsed_replay_ttl_hours: Remove parsed replays not used for this many hours
+        
         Returns:
             Dictionary with cleanup statistics
         """
-        stats = {"replays_removed": 0, "analysis_removed": 0, "files_removed": 0}
+        stats = {
+            "replays_removed": 0,
+            "analysis_removed": 0,
+            "parsed_replays_removed": 0,
+            "files_removed": 0,
+        }
         now = datetime.now()
         
         # Cleanup expired replay cache
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._get_connection() as conn:
             
             # Find expired replays
             cursor = conn.execute("""
@@ -442,9 +473,7 @@ class CacheManager:
             expired_replays = cursor.fetchall()
             
             for row in expired_replays:
-                file_path = Path(row['file_path'])
-                if file_path.exists():
-                    file_path.unlink()
+                if self._unlink_if_exists(Path(row['file_path'])):
                     stats["files_removed"] += 1
                 
                 stats["replays_removed"] += 1
@@ -465,9 +494,7 @@ class CacheManager:
             expired_analysis = cursor.fetchall()
             
             for row in expired_analysis:
-                result_path = Path(row['result_path'])
-                if result_path.exists():
-                    result_path.unlink()
+                if self._unlink_if_exists(Path(row['result_path'])):
                     stats["files_removed"] += 1
                 
                 stats["analysis_removed"] += 1
@@ -480,16 +507,47 @@ class CacheManager:
             
             conn.commit()
         
+        parsed_removed = self._cleanup_parsed_replays(parsed_replay_ttl_hours)
+        stats["parsed_replays_removed"] = parsed_removed
+        stats["files_removed"] += parsed_removed
+        
         logger.info("Cache cleanup completed", **stats)
         return stats
     
+    def _cleanup_parsed_replays(self, max_age_hours: int) -> int:
+        """Delete parsed replay files last used more than max_age_hours ago.
+        
+        ReplayProcessor touches a parsed replay on every cache hit, so its
+        modification time is the time it was last used.
+        
+        Returns:
+            Number of files removed
+        """
+        cutoff = time.time() - max_age_hours * 3600
+        removed = 0
+        
+        try:
+            entries = os.scandir(self.parsed_replays_cache)
+        except OSError:
+            return 0
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        removed += 1
+                except OSError:
+                    continue  # Removed or replaced concurrently
+        
+        return removed
+    
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
         
         Returns:
             Dictionary with cache statistics
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.execute("SELECT COUNT(*) as count, SUM(file_size) as total_size FROM replay_cache")
             replay_stats = cursor.fetchone()
             
@@ -499,30 +557,65 @@ class CacheManager:
             cursor = conn.execute("SELECT COUNT(DISTINCT gamertag) as count FROM player_history")
             player_stats = cursor.fetchone()
         
-        # Calculate directory sizes
-        def get_dir_size(directory: Path) -> int:
-            """Get total size of directory in bytes."""
-            return sum(f.stat().st_size for f in directory.rglob('*') if f.is_file())
+        # Calculate directory sizes in one walk of the cache tree
+        dir_sizes = self._get_dir_sizes()
         
         return {
             "replay_cache": {
                 "entries": replay_stats[0] or 0,
                 "total_file_size": replay_stats[1] or 0,
-                "directory_size": get_dir_size(self.replays_cache),
+                "directory_size": dir_sizes.get(self.replays_cache.name, 0),
             },
             "analysis_cache": {
                 "entries": analysis_stats[0] or 0,
-                "directory_size": get_dir_size(self.analysis_cache),
+                "directory_size": dir_sizes.get(self.analysis_cache.name, 0),
+            },
+            "parsed_replay_cache": {
+                "directory_size": dir_sizes.get(self.parsed_replays_cache.name, 0),
             },
             "player_history": {
                 "unique_players": player_stats[0] or 0,
             },
-            "total_cache_size": get_dir_size(self.base_cache_dir),
+            "total_cache_size": sum(dir_sizes.values()),
         }
     
+    def _get_dir_sizes(self) -> Dict[str, int]:
+        """Total file size in bytes under each top-level entry of the cache dir.
+        
+        Files directly in the cache dir are counted under their own name.
+        os.scandir's directory entries answer is_file()/is_dir() without a stat
+        call, so each file is stat'ed exactly once.
+        """
+        sizes: Dict[str, int] = {}
+        
+        def walk(directory: str, top_level: Optional[str]) -> None:
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                return
+            with entries:
+                for entry in entries:
+                    key = top_level or entry.name
+                    if entry.is_dir():
+                        walk(entry.path, key)
+                    elif entry.is_file():
+                        sizes[key] = sizes.get(key, 0) + entry.stat().st_size
+        
+        walk(str(self.base_cache_dir), None)
+        return sizes
+    
+    @staticmethod
+    def _unlink_if_exists(path: Path) -> bool:
+        """Delete a file, returning whether it existed."""
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        return True
+    
     def _remove_replay_cache_entry(self, replay_id: str, gamertag: str) -> None:
         """Remove a replay cache entry and its file."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.execute("""
                 SELECT file_path FROM replay_cache 
                 WHERE replay_id = ? AND gamertag = ?
@@ -530,9 +623,7 @@ class CacheManager:
             
             row = cursor.fetchone()
             if row:
-                file_path = Path(row[0])
-                if file_path.exists():
-                    file_path.unlink()
+                self._unlink_if_exists(Path(row[0]))
             
             conn.execute("""
                 DELETE FROM replay_cache 
@@ -542,7 +633,7 @@ class CacheManager:
     
     def _remove_analysis_cache_entry(self, cache_key: str) -> None:
         """Remove an analysis cache entry and its file."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.execute("""
                 SELECT result_path FROM analysis_cache 
                 WHERE cache_key = ?
@@ -550,9 +641,7 @@ class CacheManager:
             
             row = cursor.fetchone()
             if row:
-                result_path = Path(row[0])
-                if result_path.exists():
-                    result_path.unlink()
+                self._unlink_if_exists(Path(row[0]))
             
             conn.execute("DELETE FROM analysis_cache WHERE cache_key = ?", (cache_key,))
             conn.commit()
@@ -575,8 +664,15 @@ class CacheManager:
             shutil.rmtree(self.player_cache)
         if self.metadata_cache.exists():
             shutil.rmtree(self.metadata_cache)
-        
-        # Clear database
+        if self.parsed_replays_cache.exists():
+            shutil.rmtree(self.parsed_replays_cache)
+        
+        # Clear database, closing this thread's connection to the old file first
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+        self._db_generation += 1
         if self.db_path.exists():
             self.db_path.unlink()
         
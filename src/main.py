@@ -51,6 +51,13 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down Rocket League Coach")
+    
+    # Stop the replay parsing worker processes
+    try:
+        from .services.analysis_service import close_analysis_service
+        close_analysis_service()
+    except Exception as e:
+        logger.warning(f"Could not close analysis service: {e}")
 
 
 def create_app() -> FastAPI:
@@ -202,6 +202,15 @@ class AnalysisService:
         """
         return list(self._active_analyses.values())
     
+    def close(self) -> None:
+        """Release resources held by the service.
+        
+        Shuts down the replay parsing worker processes, which otherwise live
+        until interpreter exit.
+        """
+        self.replay_processor.shutdown()
+        logger.info("Analysis service closed")
+    
     async def _fetch_replay_list(self, gamertag: str, num_games: int) -> List[Dict]:
         """Fetch replay list from Ballchasing API.
         
@@ -246,94 +255,24 @@ class AnalysisService:
         Returns:
             List of processed game data
         """
-        games_data = []
+        total = len(replay_list)
+        semaphore = asyncio.Semaphore(self.settings.max_concurrent_analysis)
+        completed = 0
         
-        for i, replay_metadata in enumerate(replay_list):
-            replay_id = replay_metadata['id']
+        async def process(replay_metadata: Dict) -> Optional[GameData]:
+            nonlocal completed
+            async with semaphore:
+                game_data = await self._process_replay(replay_metadata, gamertag)
             
-            try:
-                # Update progress for this replay
-                sub_progress = (i / len(replay_list)) * 100
-                step_progress = f"Processing replay {i+1}/{len(replay_list)} ({sub_progress:.1f}%)"
-                await self._update_progress(status, 3, step_progress, progress_callback)
-                
-                # Check cache first
-                cached_replay_path = self.cache_manager.get_cached_replay(replay_id, gamertag)
-                
-                if cached_replay_path:
-                    logger.debug("Using cached replay file", replay_id=replay_id)
-                    replay_path = cached_replay_path
-                else:
-                    # Download replay file
-                    replay_content = await self.ballchasing_client.download_replay(replay_id)
-                    
-                    # Cache the replay file
-                    game_date = self._parse_replay_date(replay_metadata)
-                    game_result = self.ballchasing_client.extract_game_result(replay_metadata, gamertag)
-                    
-                    replay_path = self.cache_manager.cache_replay_file(
-                        replay_id=replay_id,
-                        gamertag=gamertag,
-                        file_content=replay_content,
-                        game_date=game_date,
-                        game_result=game_result
-                    )
-                
-                # Process replay with carball
-                game_analysis = self.replay_processor.parse_replay_file(replay_path)
-                
-                # Extract metrics
-                metrics = self.metrics_extractor.extract_mvp_metrics(game_analysis, gamertag)
-                
-                # Create game data object
-                game_data = GameData(
-                    replay_id=replay_id,
-                    gamertag=gamertag,
-                    game_date=self._parse_replay_date(replay_metadata),
-                    game_result=GameResult(self.ballchasing_client.extract_game_result(replay_metadata, gamertag)),
-                    rank_tier=self._extract_rank_tier(replay_metadata, gamertag),
-                    playlist=replay_metadata.get('playlist_name'),
-                    duration=replay_metadata.get('duration', 0),
-                    metrics=PlayerMetrics(**metrics),
-                    raw_data=game_analysis if False else None  # Only include if requested
-                )
-                
-                games_data.append(game_data)
-                
-                # Store in player history cache
-                self.cache_manager.store_player_game_history(
-                    gamertag=gamertag,
-                    replay_id=replay_id,
-                    game_date=game_data.game_date,
-                    game_result=game_data.game_result.value,
-                    rank_tier=game_data.rank_tier
-                )
-                
-                logger.debug(
-                    "Successfully processed replay",
-                    replay_id=replay_id,
-                    gamertag=gamertag,
-                    result=game_data.game_result.value
-                )
-                
-            except (ReplayProcessingError, ReplayNotFoundError) as e:
-                logger.warning(
-                    "Failed to process replay, skipping",
-                    replay_id=replay_id,
-                    gamertag=gamertag,
-                    error=str(e)
-                )
-                continue
-                
-            except Exception as e:
-                logger.error(
-                    "Unexpected error processing replay",
-                    replay_id=replay_id,
-                    gamertag=gamertag,
-                    error=str(e),
-                    error_type=type(e).__name__
-                )
-                continue
+            completed += 1
+            sub_progress = (completed / total) * 100
+            step_progress = f"Processed replay {completed}/{total} ({sub_progress:.1f}%)"
+            await self._update_progress(status, 3, step_progress, progress_callback)
+            return game_data
+        
+        # Replays are downloaded and parsed concurrently, up to the configured limit
+        results = await asyncio.gather(*(process(replay_metadata) for replay_metadata in replay_list))
+        games_data = [game_data for game_data in results if game_data is not None]
         
         logger.info(
             "Replay processing completed",
@@ -345,6 +284,98 @@ class AnalysisService:
         
         return games_data
     
+    async def _process_replay(self, replay_metadata: Dict, gamertag: str) -> Optional[GameData]:
+        """Download (or load from cache), parse and extract metrics for one replay.
+        
+        Args:
+            replay_metadata: Replay metadata
+            gamertag: Player gamertag
+            
+        Returns:
+            Processed game data, or None if the replay could not be processed
+        """
+        replay_id = replay_metadata['id']
+        
+        try:
+            game_result = self.ballchasing_client.extract_game_result(replay_metadata, gamertag)
+            
+            # Check cache first
+            cached_replay_path = self.cache_manager.get_cached_replay(replay_id, gamertag)
+            
+            if cached_replay_path:
+                logger.debug("Using cached replay file", replay_id=replay_id)
+                replay_path = cached_replay_path
+            else:
+                # Download replay file
+                replay_content = await self.ballchasing_client.download_replay(replay_id)
+                
+                # Cache the replay file
+                game_date = self._parse_replay_date(replay_metadata)
+                
+                replay_path = self.cache_manager.cache_replay_file(
+                    replay_id=replay_id,
+                    gamertag=gamertag,
+                    file_content=replay_content,
+                    game_date=game_date,
+                    game_result=game_result
+                )
+            
+            # Process replay with carball
+            game_analysis = await self.replay_processor.parse_replay_file_async(replay_path)
+            
+            # Extract metrics
+            metrics = self.metrics_extractor.extract_mvp_metrics(game_analysis, gamertag)
+            
+            # Create game data object
+            game_data = GameData(
+                replay_id=replay_id,
+                gamertag=gamertag,
+                game_date=self._parse_replay_date(replay_metadata),
+                game_result=GameResult(game_result),
+                rank_tier=self._extract_rank_tier(replay_metadata, gamertag),
+                playlist=replay_metadata.get('playlist_name'),
+                duration=replay_metadata.get('duration', 0),
+                metrics=PlayerMetrics(**metrics),
+                raw_data=game_analysis if False else None  # Only include if requested
+            )
+            
+            # Store in player history cache
+            self.cache_manager.store_player_game_history(
+                gamertag=gamertag,
+                replay_id=replay_id,
+                game_date=game_data.game_date,
+                game_result=game_data.game_result.value,
+                rank_tier=game_data.rank_tier
+            )
+            
+            logger.debug(
+                "Successfully processed replay",
+                replay_id=replay_id,
+                gamertag=gamertag,
+                result=game_data.game_result.value
+            )
+            
+            return game_data
+            
+        except (ReplayProcessingError, ReplayNotFoundError) as e:
+            logger.warning(
+                "Failed to process replay, skipping",
+                replay_id=replay_id,
+                gamertag=gamertag,
+                error=str(e)
+            )
+            return None
+            
+        except Exception as e:
+            logger.error(
+                "Unexpected error processing replay",
+                replay_id=replay_id,
+                gamertag=gamertag,
+                error=str(e),
+                error_type=type(e).__name__
+            )
+            return None
+    
     def _compile_analysis_result(
         self,
         gamertag: str,
@@ -647,3 +678,12 @@ def get_analysis_service() -> AnalysisService:
         _analysis_service = AnalysisService()
     
     return _analysis_service
+
+
+def close_analysis_service() -> None:
+    """Close the global analysis service instance, if it was created."""
+    global _analysis_service
+    
+    if _analysis_service is not None:
+        _analysis_service.close()
+        _analysis_service = None
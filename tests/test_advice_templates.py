@@ -0,0 +1,114 @@
+"""Tests for coaching message templates."""
+
+import numpy as np
+import pytest
+
+from src.analysis.advice_templates import (
+    RULE_BASED_TEMPLATES,
+    CONFIDENCE_MODIFIERS,
+    format_correlation_message,
+    format_rule_based_message,
+    get_priority_phrase,
+    PRIORITY_PHRASES,
+)
+
+
+class TestRuleBasedMessages:
+    """Test rule-based message formatting."""
+
+    @pytest.mark.parametrize("metric_name", ["avg_speed", "saves", "time_zero_boost"])
+    @pytest.mark.parametrize("comparison", ["below_rank", "at_rank", "above_rank"])
+    def test_matches_template_format(self, metric_name, comparison):
+        """Test compiled templates render exactly like str.format."""
+        expected = RULE_BASED_TEMPLATES[metric_name][comparison].format(value=1234.5, rank="gold")
+
+        message = format_rule_based_message(
+            metric_name, 1234.5, "gold", comparison, include_training=False
+        )
+
+        assert message == expected
+
+    def test_below_rank_includes_training(self):
+        """Test training packs are appended for below-rank metrics."""
+        message = format_rule_based_message("shooting_percentage", 8.0, "gold", "below_rank")
+
+        assert "Recommended training: Ultimate Shooting by Poquito, Ground Shots by Wayprotein" in message
+        assert "Redirects by IP Joker" not in message  # Only top 2
+
+    def test_str_subclass_metric_name(self):
+        """Test NumPy string metric names render like plain strings."""
+        message = format_rule_based_message(np.str_("avg_speed"), 1234.5, "gold", np.str_("at_rank"))
+
+        assert message == format_rule_based_message("avg_speed", 1234.5, "gold", "at_rank")
+
+    def test_unknown_metric_fallback(self):
+        """Test fallback message for metrics without templates."""
+        message = format_rule_based_message("assists", 2.0, "gold", "below_rank")
+
+        assert message == "Your assists is 2.0. Continue monitoring this metric."
+
+
+class TestCorrelationMessages:
+    """Test correlation message formatting."""
+
+    def test_positive_correlation(self):
+        """Test wins-better pattern for a higher-is-better metric."""
+        message = format_correlation_message("shooting_percentage", 30.0, 20.0, "high", 0.8)
+
+        assert message.startswith("In your wins, you average 30.0% vs 20.0% in losses.")
+        assert message.endswith(CONFIDENCE_MODIFIERS["high"])
+
+    def test_numpy_means(self):
+        """Test NumPy scalar means pick the same template as plain floats."""
+        message = format_correlation_message(
+            "shooting_percentage", np.float64(30.0), np.float64(20.0), "high", np.float64(0.8)
+        )
+
+        assert message == format_correlation_message("shooting_percentage", 30.0, 20.0, "high", 0.8)
+
+    def test_str_subclass_metric_name(self):
+        """Test NumPy string metric names are accepted."""
+        message = format_correlation_message(np.str_("shooting_percentage"), 30.0, 20.0, "high", 0.8)
+
+        assert message == format_correlation_message("shooting_percentage", 30.0, 20.0, "high", 0.8)
+
+    def test_nan_values_do_not_raise(self):
+        """Test missing (NaN) statistics still format a message."""
+        message = format_correlation_message(
+            "shooting_percentage", np.float64(np.nan), np.float64(20.0), "high", np.float64(np.nan)
+        )
+
+        assert "shows nan% in wins vs 20.0% in losses" in message
+
+    def test_lower_is_better_metric(self):
+        """Test direction is inverted for lower-is-better metrics."""
+        message = format_correlation_message("time_zero_boost", 20.0, 40.0, "medium", -0.8)
+
+        assert message.startswith("In your wins, you average 20.0s vs 40.0s in losses.")
+
+    def test_minimal_difference(self):
+        """Test small effect sizes use the minimal difference template."""
+        message = format_correlation_message("avg_speed", 1500.0, 1490.0, "low", 0.1)
+
+        assert message.startswith("Your average speed is consistent between wins and losses (1500 vs 1490).")
+
+    def test_unknown_metric_fallback(self):
+        """Test unknown metrics fall back without raising."""
+        message = format_correlation_message("not_a_metric", 1.0, 2.0, "high", 0.9)
+
+        assert message == "Correlation found for not_a_metric: wins avg 1.0, losses avg 2.0"
+
+
+class TestPriorityPhrases:
+    """Test priority phrase selection."""
+
+    @pytest.mark.parametrize("score, level", [
+        (0.0, "minor"),
+        (40.0, "moderate"),
+        (60.0, "important"),
+        (80.0, "critical"),
+        (float("nan"), "minor"),
+    ])
+    def test_thresholds(self, score, level):
+        """Test scores map to the phrase of the threshold they reach."""
+        assert get_priority_phrase(score) == PRIORITY_PHRASES[level]
@@ -2,6 +2,8 @@
 
 import pytest
 import asyncio
+import os
+import time
 from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime
 
@@ -40,8 +42,12 @@ def mock_ballchasing_client():
     # Mock replay download
     client.download_replay = AsyncMock(return_value=b'mock_replay_data')
     
-    # Mock game result extraction
-    client.extract_game_result = Mock(side_effect=['win', 'loss'])
+    # Mock game result extraction (called once per replay, and replays are
+    # processed concurrently, so key the result by replay id)
+    game_results = {'replay_1': 'win', 'replay_2': 'loss'}
+    client.extract_game_result = Mock(
+        side_effect=lambda replay_metadata, gamertag: game_results[replay_metadata['id']]
+    )
     
     return client
 
@@ -50,7 +56,7 @@ def mock_ballchasing_client():
 def mock_replay_processor():
     """Mock replay processor."""
     processor = Mock()
-    processor.parse_replay_file = Mock(return_value={
+    processor.parse_replay_file_async = AsyncMock(return_value={
         'game_stats': {},
         'player_stats': {},
         'teams': []
@@ -157,7 +163,8 @@ class TestAnalysisService:
         # Verify components were called
         mock_ballchasing_client.search_player_replays.assert_called_once_with("TestPlayer", count=2)
         assert mock_ballchasing_client.download_replay.call_count == 2
-        assert mock_replay_processor.parse_replay_file.call_count == 2
+        assert mock_ballchasing_client.extract_game_result.call_count == 2
+        assert mock_replay_processor.parse_replay_file_async.await_count == 2
         assert mock_metrics_extractor.extract_mvp_metrics.call_count == 2
         mock_statistical_analyzer.analyze_win_loss_correlations.assert_called_once()
         mock_coach.generate_rule_based_insights.assert_called_once()
@@ -210,6 +217,16 @@ class TestAnalysisService:
         assert result.gamertag == "CachedPlayer"
         assert result.win_rate == 60.0
 
+    
+    def test_close_shuts_down_replay_processor(self, mock_replay_processor):
+        """Test closing the service stops the replay parsing workers."""
+        
+        service = AnalysisService()
+        service.replay_processor = mock_replay_processor
+        
+        service.close()
+        
+        mock_replay_processor.shutdown.assert_called_once_with()
 
 class TestCacheManager:
     """Test cache management functionality."""
@@ -293,6 +310,28 @@ class TestCacheManager:
         
         # Verify cleanup occurred
         assert stats["replays_removed"] >= 0
+    
+    def test_parsed_replay_cache_cleanup(self, temp_cache_dir):
+        """Test unused parsed replays are evicted and cleared with the cache."""
+        
+        cache_manager = CacheManager(temp_cache_dir)
+        
+        stale = cache_manager.parsed_replays_cache / "stale.json"
+        fresh = cache_manager.parsed_replays_cache / "fresh.json"
+        stale.write_bytes(b"{}")
+        fresh.write_bytes(b"{}")
+        old = time.time() - 200 * 3600
+        os.utime(stale, (old, old))
+        
+        stats = cache_manager.cleanup_expired_cache(parsed_replay_ttl_hours=168)
+        
+        assert stats["parsed_replays_removed"] == 1
+        assert not stale.exists()
+        assert fresh.exists()
+        
+        cache_manager.clear_cache(confirm=True)
+        
+        assert not fresh.exists()
         assert stats["files_removed"] >= 0
 
 
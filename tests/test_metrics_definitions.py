@@ -0,0 +1,40 @@
+"""Tests for metric definitions."""
+
+import copy
+import pickle
+
+import pytest
+
+from src.analysis.metrics_definitions import METRIC_DEFINITIONS, get_rank_benchmark
+
+
+class TestMetricDefinition:
+    """Test MetricDefinition behaviour."""
+
+    @pytest.mark.parametrize("clone", [
+        lambda definition: pickle.loads(pickle.dumps(definition)),
+        copy.copy,
+        copy.deepcopy,
+    ], ids=["pickle", "copy", "deepcopy"])
+    def test_round_trip(self, clone):
+        """Test definitions survive pickling and copying unchanged."""
+        definition = METRIC_DEFINITIONS["avg_speed"]
+
+        restored = clone(definition)
+
+        assert restored == definition
+        assert restored.tier is definition.tier
+
+
+class TestRankBenchmarks:
+    """Test rank benchmark lookups."""
+
+    @pytest.mark.parametrize("metric_name", ["avg_speed", "not_a_metric"])
+    def test_returned_benchmark_is_independent(self, metric_name):
+        """Test mutating a returned benchmark does not affect later lookups."""
+        benchmark = get_rank_benchmark("gold", metric_name)
+        expected = dict(benchmark)
+
+        benchmark["min"] = -1
+
+        assert get_rank_benchmark("gold", metric_name) == expected
@@ -4,7 +4,14 @@ import pytest
 import numpy as np
 from unittest.mock import Mock, patch
 
-from src.analysis.statistical_analyzer import StatisticalAnalyzer, CorrelationResult
+from scipy.stats import ttest_ind
+
+from src.analysis.statistical_analyzer import (
+    StatisticalAnalyzer,
+    CorrelationResult,
+    _column_moments,
+    _clipped_column_moments,
+)
 from src.analysis.exceptions import InsufficientDataException
 from src.analysis.metrics_definitions import MetricTier
 
@@ -225,6 +232,63 @@ class TestStatisticalAnalyzer:
         assert effect_size > 0  # Wins should be higher
         assert effect_size > 1.0  # Should be a large effect
     
+    def test_analyze_metrics_matches_scipy(self, analyzer):
+        """Test the batched analysis agrees with scipy's t-test for every metric."""
+        wins_metrics = {
+            'avg_speed': np.array([1800.0, 1850.0, 1900.0, 1950.0, 2000.0, 1875.0]),
+            'shooting_percentage': np.array([25.0, 27.0, 29.0, 31.0, 33.0]),
+        }
+        losses_metrics = {
+            'avg_speed': np.array([1400.0, 1450.0, 1500.0, 1550.0, 1600.0]),
+            'shooting_percentage': np.array([15.0, 17.0, 19.0, 21.0, 23.0, 18.0, 16.0]),
+        }
+        
+        results = analyzer._analyze_metrics(
+            list(wins_metrics), wins_metrics, losses_metrics, 5
+        )
+        
+        assert set(results) == set(wins_metrics)
+        for name, result in results.items():
+            wins, losses = wins_metrics[name], losses_metrics[name]
+            expected = ttest_ind(wins, losses, equal_var=False)
+            assert result.wins_mean == pytest.approx(np.mean(wins))
+            assert result.losses_mean == pytest.approx(np.mean(losses))
+            assert result.wins_std == pytest.approx(np.std(wins, ddof=1))
+            assert result.losses_std == pytest.approx(np.std(losses, ddof=1))
+            assert result.p_value == pytest.approx(expected.pvalue)
+            assert result.effect_size == pytest.approx(
+                analyzer._calculate_cohens_d(wins, losses)
+            )
+    
+    def test_column_moments_skips_nan_padding(self):
+        """Test the compiled moments kernel matches NumPy's NaN-aware reductions."""
+        matrix = np.array([
+            [1800.0, 25.0, np.nan],
+            [1850.0, 27.0, np.nan],
+            [1900.0, np.nan, np.nan],
+            [1950.0, np.nan, np.nan],
+        ])
+        
+        counts, means, variances = _column_moments(matrix)
+        
+        assert counts.tolist() == [4, 2, 0]
+        assert means[:2] == pytest.approx(np.nanmean(matrix[:, :2], axis=0))
+        assert variances[:2] == pytest.approx(np.nanvar(matrix[:, :2], axis=0, ddof=1))
+        assert np.isnan(means[2]) and np.isnan(variances[2])
+    
+    def test_clipped_column_moments_matches_remove_outliers(self, analyzer):
+        """Test the fused kernel drops the same outliers as _remove_outliers."""
+        column = np.array([10.0] * 12 + [11.0] * 12 + [500.0])
+        matrix = np.column_stack([column, np.full(column.size, 5.0)])
+        
+        counts, means, variances = _clipped_column_moments(matrix, 3.0)
+        kept = analyzer._remove_outliers(column)
+        
+        assert counts.tolist() == [kept.size, column.size]
+        assert means[0] == pytest.approx(np.mean(kept))
+        assert variances[0] == pytest.approx(np.var(kept, ddof=1))
+        assert means[1] == 5.0 and variances[1] == 0.0
+    
     @patch('src.analysis.statistical_analyzer.get_metric_definition')
     def test_insight_message_generation(self, mock_get_definition, analyzer):
         """Test insight message generation."""